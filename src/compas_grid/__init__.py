@@ -20,4 +20,4 @@ DATA = os.path.abspath(os.path.join(HOME, "data"))
 DOCS = os.path.abspath(os.path.join(HOME, "docs"))
 TEMP = os.path.abspath(os.path.join(HOME, "temp"))
 
-__all__ = ["HOME", "DATA", "DOCS", "TEMP", "GridModel"]
+__all__ = ["HOME", "DATA", "DOCS", "TEMP"]
@@ -0,0 +1,411 @@
+from functools import lru_cache
+from typing import Optional
+from typing import Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.spatial import ConvexHull
+
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Brep
+from compas.geometry import Frame
+from compas.geometry import Polygon
+from compas.geometry import Transformation
+from compas.geometry import oriented_bounding_box
+from compas.geometry import transform_points_numpy
+from compas.tolerance import TOL
+
+
+def convex_hull_mesh_numpy(points: ArrayLike) -> Mesh:
+    """Compute the convex hull of a set of points as a mesh with outward facing triangles.
+
+    Parameters
+    ----------
+    points : array-like
+        The XYZ coordinates of the points, as a list of lists or an array of shape (N, 3).
+
+    Returns
+    -------
+    :class:`compas.datastructures.Mesh`
+        The convex hull, containing only the points on the hull.
+
+    """
+    points: np.ndarray = np.asarray(points, dtype=float)[:, :3]
+
+    # Drop duplicate points, for example the shared corners of mesh copies, so Qhull does not process them.
+    _, unique = np.unique(points.round(8), axis=0, return_index=True)
+    points = points[np.sort(unique)]
+    hull: ConvexHull = ConvexHull(points)
+
+    # Qhull does not orient its facets, flip the ones pointing against the outward facet normals.
+    simplices: np.ndarray = hull.simplices
+    a, b, c = points[simplices[:, 0]], points[simplices[:, 1]], points[simplices[:, 2]]
+    flip: np.ndarray = np.einsum("ij,ij->i", np.cross(b - a, c - a), hull.equations[:, :3]) < 0
+    simplices[flip] = simplices[flip][:, ::-1]
+
+    # Remap the facet indices from the input points to the points on the hull.
+    index: np.ndarray = np.full(len(points), -1, dtype=int)
+    index[hull.vertices] = np.arange(len(hull.vertices))
+    return Mesh.from_vertices_and_faces(points[hull.vertices].tolist(), index[simplices].tolist())
+
+
+def mesh_transformed_numpy(mesh: Mesh, transformation: Transformation) -> Mesh:
+    """Transform a copy of a mesh, applying the transformation to all vertices in a single matrix product.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh to transform.
+    transformation : :class:`compas.geometry.Transformation`
+        The transformation.
+
+    Returns
+    -------
+    :class:`compas.datastructures.Mesh`
+        The transformed copy of the mesh.
+
+    """
+    mesh: Mesh = mesh.copy()
+    points: np.ndarray = transform_points_numpy(mesh_points_numpy(mesh), transformation)
+    for attr, (x, y, z) in zip(mesh.vertex.values(), points.tolist()):
+        attr["x"] = x
+        attr["y"] = y
+        attr["z"] = z
+    return mesh
+
+
+def mesh_points_numpy(mesh: Mesh) -> np.ndarray:
+    """Gather the XYZ coordinates of all vertices of a mesh into a single array.
+    The coordinates are read directly from the vertex attribute dicts, without the default lookups of ``vertices_attributes``.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The XYZ coordinates of the vertices, as an array of shape (V, 3) in the order of the vertices of the mesh.
+
+    """
+    return np.array([(attr["x"], attr["y"], attr["z"]) for attr in mesh.vertex.values()], dtype=float).reshape(-1, 3)
+
+
+def cached_mesh_points_numpy(cache: Optional[tuple[Mesh, np.ndarray]], mesh: Mesh) -> tuple[Mesh, np.ndarray]:
+    """Get the vertex coordinates of a mesh from a cache, gathering them again only if the cache belongs to another mesh object.
+    Elements cache the coordinates of their model geometry this way, since compas_model replaces the mesh when it is recomputed.
+
+    Parameters
+    ----------
+    cache : tuple[:class:`compas.datastructures.Mesh`, :class:`numpy.ndarray`], optional
+        The cached mesh and its vertex coordinates.
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh.
+
+    Returns
+    -------
+    tuple[:class:`compas.datastructures.Mesh`, :class:`numpy.ndarray`]
+        The updated cache.
+
+    """
+    if cache is None or cache[0] is not mesh:
+        cache = (mesh, mesh_points_numpy(mesh))
+    return cache
+
+
+def faces_packed_numpy(vertices: ArrayLike, faces: list[list[int]], dtype: type = np.float32) -> np.ndarray:
+    """Gather the vertex coordinates of mesh faces into a single array, padding faces with fewer vertices with NaN.
+
+    Parameters
+    ----------
+    vertices : array-like
+        The XYZ coordinates of the vertices, as a list of lists or an array of shape (V, 3).
+    faces : list[list[int]]
+        The vertex indices of the faces.
+    dtype : type, optional
+        The data type of the result.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The face coordinates, as an array of shape (F, maxV, 3).
+
+    """
+    vertices: np.ndarray = np.asarray(vertices, dtype=dtype)
+    size: int = max((len(face) for face in faces), default=0)
+    index: np.ndarray = np.full((len(faces), size), -1, dtype=int)
+    for i, face in enumerate(faces):
+        index[i, : len(face)] = face
+    packed: np.ndarray = vertices[index]
+    packed[index < 0] = np.nan
+    return packed
+
+
+def inflate_box(box: Box, inflate: Optional[float] = None) -> Box:
+    """Inflate the dimensions of a bounding box in place.
+
+    Parameters
+    ----------
+    box : :class:`compas.geometry.Box`
+        The bounding box.
+    inflate : float, optional
+        The value added to each dimension of the box.
+        No inflation is applied if the value is ``None``, zero or one.
+
+    Returns
+    -------
+    :class:`compas.geometry.Box`
+        The inflated box.
+
+    """
+    if inflate and inflate != 1.0:
+        box.xsize, box.ysize, box.zsize = box.xsize + inflate, box.ysize + inflate, box.zsize + inflate
+    return box
+
+
+def is_point_in_polygons_xy_numpy(points: ArrayLike, polygons: ArrayLike) -> np.ndarray:
+    """Determine for pairs of points and polygons on the XY-plane if the point is in the interior of the polygon.
+    This is the crossing number test of :func:`compas.geometry.is_point_in_polygon_xy`, evaluated for all pairs at once.
+
+    Parameters
+    ----------
+    points : array-like
+        The XY(Z) coordinates of the points, as an array of shape (F, 2) or (F, 3).
+    polygons : array-like
+        The XY(Z) coordinates of the polygon corners, as an array of shape (F, K, 2) or (F, K, 3).
+        Polygons with fewer than K corners are padded by repeating their first corner.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        A boolean array of shape (F,).
+
+    """
+    points: np.ndarray = np.asarray(points, dtype=float)
+    polygons: np.ndarray = np.asarray(polygons, dtype=float)
+    x: np.ndarray = points[:, 0, np.newaxis]
+    y: np.ndarray = points[:, 1, np.newaxis]
+    x1: np.ndarray = np.roll(polygons[:, :, 0], 1, axis=1)
+    y1: np.ndarray = np.roll(polygons[:, :, 1], 1, axis=1)
+    x2: np.ndarray = polygons[:, :, 0]
+    y2: np.ndarray = polygons[:, :, 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xinters: np.ndarray = (y - y1) * (x2 - x1) / (y2 - y1) + x1
+    crossing: np.ndarray = (y > np.minimum(y1, y2)) & (y <= np.maximum(y1, y2)) & (x <= np.maximum(x1, x2)) & ((x1 == x2) | (x <= xinters))
+    return crossing.sum(axis=1) % 2 == 1
+
+
+def extrude_points_z_numpy(points: ArrayLike, start: float, end: float) -> tuple[np.ndarray, np.ndarray]:
+    """Project the points of a section onto the bottom and top planes of a vertical extrusion.
+
+    Parameters
+    ----------
+    points : array-like
+        The XYZ coordinates of the section points, as a list of lists or an array of shape (N, 3).
+    start : float
+        The Z-coordinate of the bottom plane.
+    end : float
+        The Z-coordinate of the top plane.
+
+    Returns
+    -------
+    tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`]
+        The bottom and top points, each as an array of shape (N, 3).
+
+    """
+    points: np.ndarray = np.asarray(points, dtype=float)[:, :3]
+    bottom: np.ndarray = points.copy()
+    bottom[:, 2] = start
+    top: np.ndarray = points.copy()
+    top[:, 2] = end
+    return bottom, top
+
+
+def aabb_from_points_numpy(points: ArrayLike, inflate: Optional[float] = None) -> Box:
+    """Compute the axis-aligned bounding box of a set of points.
+
+    Parameters
+    ----------
+    points : array-like
+        The XYZ coordinates of the points, as a list of lists or an array of shape (N, 3).
+    inflate : float, optional
+        The value added to each dimension of the box, as in :func:`inflate_box`.
+
+    Returns
+    -------
+    :class:`compas.geometry.Box`
+        The axis-aligned bounding box.
+
+    """
+    points: np.ndarray = np.asarray(points, dtype=float)[:, :3]
+    return box_from_bounds(points.min(axis=0).tolist(), points.max(axis=0).tolist(), inflate)
+
+
+def aabb_numpy(geometry: Union[Mesh, Brep]) -> Box:
+    """Compute the axis-aligned bounding box of the geometry of an element.
+    The box of a mesh is computed from a single array of its vertex coordinates,
+    other geometry computes its own box.
+
+    Parameters
+    ----------
+    geometry : :class:`compas.datastructures.Mesh` | :class:`compas.geometry.Brep`
+        The geometry.
+
+    Returns
+    -------
+    :class:`compas.geometry.Box`
+        The axis-aligned bounding box.
+
+    """
+    if isinstance(geometry, Mesh):
+        return aabb_from_points_numpy(mesh_points_numpy(geometry))
+    return geometry.aabb()
+
+
+def obb_from_points_numpy(points: ArrayLike) -> Box:
+    """Compute an oriented bounding box of a set of points along their principal axes.
+    The axes are the eigenvectors of the covariance matrix of the points, which is much cheaper than a minimum volume box.
+    If two principal axes are not unique, because their variances are equal and not zero,
+    the box falls back to :func:`compas.geometry.oriented_bounding_box`, since the axes would otherwise be arbitrary.
+
+    Parameters
+    ----------
+    points : array-like
+        The XYZ coordinates of the points, as a list of lists or an array of shape (N, 3).
+
+    Returns
+    -------
+    :class:`compas.geometry.Box`
+        The oriented bounding box.
+
+    """
+    points: np.ndarray = np.asarray(points, dtype=float)[:, :3]
+    centroid: np.ndarray = points.mean(axis=0)
+    centered: np.ndarray = points - centroid
+    variances, axes = np.linalg.eigh(centered.T @ centered)
+
+    tolerance: float = TOL.relative * variances[-1]
+    if np.any((np.diff(variances) <= tolerance) & (variances[1:] > tolerance)):
+        return Box.from_bounding_box(oriented_bounding_box(points))
+
+    # The eigenvalues are sorted in ascending order, use the axis of largest variance as X-axis of a right-handed frame.
+    xaxis: np.ndarray = axes[:, 2]
+    yaxis: np.ndarray = axes[:, 1]
+    axes = np.stack((xaxis, yaxis, np.cross(xaxis, yaxis)), axis=1)
+    local: np.ndarray = centered @ axes
+    lower: np.ndarray = local.min(axis=0)
+    upper: np.ndarray = local.max(axis=0)
+    size: list[float] = (upper - lower).tolist()
+    frame: Frame = Frame((centroid + axes @ (0.5 * (lower + upper))).tolist(), xaxis.tolist(), yaxis.tolist())
+    return Box(size[0], size[1], size[2], frame=frame)
+
+
+def box_from_bounds(lower: list[float], upper: list[float], inflate: Optional[float] = None) -> Box:
+    """Construct an axis-aligned box from its lower and upper bounds.
+    The inflation is applied to the dimensions before the box is constructed, instead of resizing the box afterwards.
+
+    Parameters
+    ----------
+    lower : list[float]
+        The minimum XYZ coordinates of the box.
+    upper : list[float]
+        The maximum XYZ coordinates of the box.
+    inflate : float, optional
+        The value added to each dimension of the box, as in :func:`inflate_box`.
+
+    Returns
+    -------
+    :class:`compas.geometry.Box`
+        The axis-aligned box.
+
+    """
+    xmin, ymin, zmin = lower
+    xmax, ymax, zmax = upper
+    frame: Frame = Frame([0.5 * (xmin + xmax), 0.5 * (ymin + ymax), 0.5 * (zmin + zmax)], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0])
+    offset: float = inflate if inflate and inflate != 1.0 else 0.0
+    return Box(xmax - xmin + offset, ymax - ymin + offset, zmax - zmin + offset, frame=frame)
+
+
+def face_polygons_numpy(mesh: Mesh) -> list[Polygon]:
+    """Construct the polygons of all faces of a mesh from a single gather of the vertex coordinates.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        The mesh.
+
+    Returns
+    -------
+    list[:class:`compas.geometry.Polygon`]
+        The face polygons, in the order of the faces of the mesh.
+
+    """
+    vertices, faces = mesh.to_vertices_and_faces()
+    vertices: np.ndarray = np.asarray(vertices, dtype=float)
+    return [Polygon(vertices[face].tolist()) for face in faces]
+
+
+@lru_cache(maxsize=64)
+def _prism_faces(n: int) -> tuple[tuple[int, ...], ...]:
+    i: np.ndarray = np.arange(n)
+    j: np.ndarray = (i + 1) % n
+    sides: np.ndarray = np.stack((i, j, j + n, i + n), axis=1)
+    return (tuple(range(n - 1, -1, -1)), tuple(range(n, 2 * n))) + tuple(map(tuple, sides.tolist()))
+
+
+def prism_faces(n: int) -> list[list[int]]:
+    """Compute the faces of a prism between a bottom and a top polygon with the same number of points.
+    The faces only depend on the number of points and are memoized on it.
+
+    Parameters
+    ----------
+    n : int
+        The number of points of the bottom and top polygons.
+
+    Returns
+    -------
+    list[list[int]]
+        The reversed bottom face, the top face and the side faces,
+        where the vertices of the bottom polygon are numbered before the vertices of the top polygon.
+
+    """
+    return [list(face) for face in _prism_faces(n)]
+
+
+def extrude_points_numpy(points: ArrayLike, start: ArrayLike, end: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+    """Project the points of a section onto the end planes of an extrusion along an axis.
+    The lines through all points along the axis are intersected with both planes normal to the axis at once,
+    as :func:`compas.geometry.intersection_line_plane` does for a single line and plane.
+
+    Parameters
+    ----------
+    points : array-like
+        The XYZ coordinates of the section points, as a list of lists or an array of shape (N, 3).
+    start : array-like
+        The start point of the axis.
+    end : array-like
+        The end point of the axis.
+
+    Returns
+    -------
+    tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`]
+        The points on the planes through the start and the end of the axis, each as an array of shape (N, 3).
+
+    Raises
+    ------
+    ValueError
+        If the axis has zero length.
+
+    """
+    points: np.ndarray = np.asarray(points, dtype=float)[:, :3]
+    planes: np.ndarray = np.asarray([start, end], dtype=float)[:, :3]
+    vector: np.ndarray = planes[1] - planes[0]
+    length: float = float(np.linalg.norm(vector))
+    if TOL.is_zero(length):
+        raise ValueError("The line does not intersect the plane")
+    normal: np.ndarray = vector / length
+    ratios: np.ndarray = np.einsum("pnj,j->pn", planes[:, np.newaxis, :] - points, normal) / vector.dot(normal)
+    result: np.ndarray = points + ratios[:, :, np.newaxis] * vector
+    return result[0], result[1]
@@ -17,20 +17,20 @@ from .cut import CutElement
 
 
 __all__ = [
-    BeamShapeElement,
-    BlockFeature,
-    BlockElement,
-    PlateFeature,
-    PlateElement,
-    ColumnHeadElement,
-    ColumnHeadCrossElement,
-    BeamFeature,
-    BeamElement,
-    BeamProfileElement,
-    ColumnFeature,
-    ColumnElement,
-    CableFeature,
-    CableElement,
-    CutFeature,
-    CutElement,
+    "BeamShapeElement",
+    "BlockFeature",
+    "BlockElement",
+    "PlateFeature",
+    "PlateElement",
+    "ColumnHeadElement",
+    "ColumnHeadCrossElement",
+    "BeamFeature",
+    "BeamElement",
+    "BeamProfileElement",
+    "ColumnFeature",
+    "ColumnElement",
+    "CableFeature",
+    "CableElement",
+    "CutFeature",
+    "CutElement",
 ]
@@ -1,8 +1,11 @@
+from functools import lru_cache
 from typing import Optional
 from typing import Union
 
+import numpy as np
 from compas_model.elements.element import Element
 from compas_model.elements.element import Feature
+from compas_model.elements.element import reset_computed
 from compas_model.interactions import BooleanModifier
 from compas_model.interactions import Modifier
 from compas_model.interactions import SlicerModifier
@@ -18,13 +21,61 @@ from compas.geometry import Polygon
 from compas.geometry import Scale
 from compas.geometry import Transformation
 from compas.geometry import Translation
+from compas.geometry import boolean_intersection_mesh_mesh
 from compas.geometry import bounding_box
-from compas.geometry import intersection_line_plane
-from compas.geometry import is_point_in_polygon_xy
-from compas.geometry import mirror_points_line
+from compas.geometry import earclip_polygon
+from compas.geometry import transform_points_numpy
+from compas.itertools import pairwise
+from compas.tolerance import TOL
+from compas_grid._geometry import aabb_from_points_numpy
+from compas_grid._geometry import aabb_numpy
+from compas_grid._geometry import cached_mesh_points_numpy
+from compas_grid._geometry import extrude_points_z_numpy
+from compas_grid._geometry import inflate_box
+from compas_grid._geometry import is_point_in_polygons_xy_numpy
+from compas_grid._geometry import mesh_transformed_numpy
+from compas_grid._geometry import obb_from_points_numpy
 from compas_grid.elements import BlockElement
 
 
+@lru_cache(maxsize=256)
+def _loft_faces(points: tuple[tuple[float, float], ...]) -> tuple[tuple[int, ...], ...]:
+    """Compute the faces of a section extruded along the Z-axis, memoized on the XY-coordinates of the section.
+    The faces do not depend on the length of the extrusion, so changing the length of a beam only updates its vertices.
+
+    Parameters
+    ----------
+    points : tuple[tuple[float, float], ...]
+        The XY-coordinates of the section points.
+
+    Returns
+    -------
+    tuple[tuple[int, ...], ...]
+        The vertex indices of the bottom, top and side faces,
+        where the indices of the top vertices are offset by the number of section points.
+
+    """
+    offset: int = len(points)
+    triangles: list[list[int]] = earclip_polygon(Polygon([[x, y, 0.0] for x, y in points]))
+    top_faces: list[list[int]] = []
+    bottom_faces: list[list[int]] = []
+    for i in range(len(triangles)):
+        # Create bottom faces with original winding
+        bottom_faces.append(triangles[i])
+        # Create top faces with consistent winding and offset
+        top_face = [triangles[i][0] + offset, triangles[i][2] + offset, triangles[i][1] + offset]
+        top_faces.append(top_face)
+
+    faces: list[list[int]] = bottom_faces + top_faces
+
+    # Create side faces with consistent winding
+    bottom: list[int] = list(range(offset))
+    top: list[int] = [i + offset for i in bottom]
+    for (a, b), (c, d) in zip(pairwise(bottom + bottom[:1]), pairwise(top + top[:1])):
+        faces.append([a, c, d, b])  # Changed winding order for side faces
+    return tuple(map(tuple, faces))
+
+
 class BeamFeature(Feature):
     pass
 
@@ -85,7 +136,8 @@ class BeamElement(Element):
     ) -> "BeamElement":
         super().__init__(transformation=transformation, features=features, name=name)
         self._box = Box.from_width_height_depth(width, length, height)
-        self._box.frame = Frame(point=[0, 0, self._box.zsize / 2], xaxis=[1, 0, 0], yaxis=[0, 1, 0])
+        self._box.frame.point = [0, 0, self._box.zsize / 2]
+        self._slicer_faces: Optional[tuple[Mesh, Transformation, tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]] = None
 
     @property
     def box(self) -> Box:
@@ -96,6 +148,7 @@ class BeamElement(Element):
         return self.box.xsize
 
     @width.setter
+    @reset_computed
     def width(self, width: float):
         self.box.xsize = width
 
@@ -104,6 +157,7 @@ class BeamElement(Element):
         return self.box.ysize
 
     @height.setter
+    @reset_computed
     def height(self, height: float):
         self.box.ysize = height
 
@@ -112,9 +166,10 @@ class BeamElement(Element):
         return self.box.zsize
 
     @length.setter
+    @reset_computed
     def length(self, length: float):
         self.box.zsize = length
-        self.box.frame = Frame(point=[0, 0, self.box.zsize / 2], xaxis=[1, 0, 0], yaxis=[0, 1, 0])
+        self.box.frame.point = [0, 0, self.box.zsize / 2]
 
     @property
     def center_line(self) -> Line:
@@ -129,6 +184,7 @@ class BeamElement(Element):
         """
         return self.box.to_mesh()
 
+    @reset_computed
     def extend(self, distance: float) -> None:
         """Extend the beam.
 
@@ -139,7 +195,7 @@ class BeamElement(Element):
         """
 
         self.box.zsize = self.length + distance * 2
-        self.box.frame = Frame(point=[0, 0, self.box.zsize / 2 - distance], xaxis=[1, 0, 0], yaxis=[0, 1, 0])
+        self.box.frame.point = [0, 0, self.box.zsize / 2 - distance]
 
     def compute_aabb(self, inflate: Optional[bool] = None) -> Box:
         """Compute the axis-aligned bounding box of the element.
@@ -155,12 +211,8 @@ class BeamElement(Element):
             The axis-aligned bounding box.
         """
 
-        box = self.box.transformed(self.modeltransformation)
-        box = Box.from_bounding_box(box.points)
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        points: np.ndarray = transform_points_numpy(self.box.points, self.modeltransformation)
+        box = aabb_from_points_numpy(points, inflate)
         self._aabb = box
         return box
 
@@ -178,10 +230,7 @@ class BeamElement(Element):
             The oriented bounding box.
         """
         box = self.box.transformed(self.modeltransformation)
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = inflate_box(box, inflate)
         self._obb = box
         return box
 
@@ -193,7 +242,7 @@ class BeamElement(Element):
         :class:`compas.datastructures.Mesh`
             The collision mesh.
         """
-        return self.modelgeometry.to_mesh()
+        return mesh_transformed_numpy(self.elementgeometry, self.modeltransformation)
 
     def compute_point(self) -> Point:
         """Compute the reference point of the beam from the centroid of its geometry.
@@ -212,43 +261,74 @@ class BeamElement(Element):
     def _add_modifier_with_beam(self, target_element: "BeamElement", type: str) -> Union["BooleanModifier", None]:
         # Scenario:
         # A cable applies boolean difference with a block geometry.
-        return BooleanModifier(self.elementgeometry.transformed(self.modeltransformation))
+        return BooleanModifier(mesh_transformed_numpy(self.elementgeometry, self.modeltransformation))
 
     def _add_modifier_with_block(self, target_element: "BlockElement", type: str) -> Union["BooleanModifier", None]:
         # Scenario:
         # A beam with a profile applies boolean difference with a block geometry.
         if target_element.is_support:
-            return BooleanModifier(self.elementgeometry.transformed(self.modeltransformation))
+            return BooleanModifier(mesh_transformed_numpy(self.elementgeometry, self.modeltransformation))
         else:
             return None
 
+    def _compute_slicer_faces(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the face data used to detect the slicing plane of a target element.
+        The result is cached until the element geometry or the model transformation is recomputed.
+
+        Returns
+        -------
+        tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`]
+            For the F faces of the geometry in model coordinates,
+            the origins (F, 3) and normals (F, 3) of the face planes,
+            the transformations (F, 4, 4) from the face frames to the world XY frame,
+            and the face polygons (F, K, 3) in the world XY frame, padded by repeating their first corner.
+
+        """
+        elementgeometry: Mesh = self.elementgeometry
+        modeltransformation: Transformation = self.modeltransformation
+        if self._slicer_faces is not None and self._slicer_faces[0] is elementgeometry and self._slicer_faces[1] is modeltransformation:
+            return self._slicer_faces[2]
+
+        mesh = mesh_transformed_numpy(elementgeometry, modeltransformation)
+        frames: list[Frame] = [mesh.face_polygon(face).frame for face in mesh.faces()]
+        origins: np.ndarray = np.asarray([frame.point for frame in frames], dtype=float)
+        normals: np.ndarray = np.asarray([frame.normal for frame in frames], dtype=float)
+        xforms: np.ndarray = np.asarray([Transformation.from_frame_to_frame(frame, Frame.worldXY()).matrix for frame in frames], dtype=float)
+
+        vertices, faces = mesh.to_vertices_and_faces()
+        size: int = max(len(face) for face in faces)
+        polygons: np.ndarray = np.asarray(vertices, dtype=float)[[face + face[:1] * (size - len(face)) for face in faces]]
+        polygons = np.einsum("fij,fkj->fki", xforms[:, :3, :3], polygons) + xforms[:, np.newaxis, :3, 3]
+
+        data: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] = (origins, normals, xforms, polygons)
+        self._slicer_faces = (elementgeometry, modeltransformation, data)
+        return data
+
     def _create_slicer_modifier(self, target_element: "BeamElement") -> Modifier:
         # This method performs mesh-ray intersection for detecting the slicing plane.
-        mesh = self.elementgeometry.transformed(self.modeltransformation)
+        origins, normals, xforms, polygons = self._compute_slicer_faces()
         center_line: Line = target_element.center_line.transformed(target_element.modeltransformation)
 
-        p0 = center_line.start
-        p1 = center_line.end
+        p0: np.ndarray = np.asarray(center_line.start, dtype=float)
+        p1: np.ndarray = np.asarray(center_line.end, dtype=float)
+
+        # Intersect the center line with the planes of all faces at once, see :func:`compas.geometry.intersection_line_plane`.
+        cosa: np.ndarray = normals @ (p1 - p0)
+        hit: np.ndarray = np.abs(cosa) >= TOL.absolute
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio: np.ndarray = -np.einsum("fj,fj->f", normals, p0 - origins) / cosa
+            points: np.ndarray = p0 + ratio[:, np.newaxis] * (p1 - p0)
+
+        local: np.ndarray = np.einsum("fij,fj->fi", xforms[:, :3, :3], points) + xforms[:, :3, 3]
+        hit[hit] = is_point_in_polygons_xy_numpy(local[hit], polygons[hit])
 
-        closest_distance_to_end_point = float("inf")
         closest_face = 0
-        for face in self.elementgeometry.faces():
-            polygon = mesh.face_polygon(face)
-            frame = polygon.frame
-            result = intersection_line_plane(center_line, Plane.from_frame(frame))
-            if result:
-                point = Point(*result)
-                xform = Transformation.from_frame_to_frame(frame, Frame.worldXY())
-                point = point.transformed(xform)
-                polygon = polygon.transformed(xform)
-                if is_point_in_polygon_xy(point, polygon):
-                    d = max(p0.distance_to_point(point), p1.distance_to_point(point))
-                    if d < closest_distance_to_end_point:
-                        closest_distance_to_end_point = d
-                        closest_face = face
-
-        plane = Plane.from_frame(mesh.face_polygon(closest_face).frame)
-        plane = Plane(plane.point, -plane.normal)
+        if hit.any():
+            d: np.ndarray = np.maximum(np.linalg.norm(points - p0, axis=1), np.linalg.norm(points - p1, axis=1))
+            d[~hit] = np.inf
+            closest_face = int(np.argmin(d))
+
+        plane = Plane(origins[closest_face].tolist(), (-normals[closest_face]).tolist())
         return SlicerModifier(plane)
 
 
@@ -310,6 +390,7 @@ class BeamProfileElement(BeamElement):
         box = Box.from_points(bounding_box(polygon.points))
         self.width = box.xsize
         self.height = box.ysize
+        self._modelpoints: Optional[tuple[Mesh, np.ndarray]] = None
 
     @property
     def shape(self) -> Mesh:
@@ -320,45 +401,15 @@ class BeamProfileElement(BeamElement):
         self._shape = shape
         self._geometry = None
 
-    def _loft(self, polygon: Polygon) -> Mesh:
-        plane0: Plane = Plane(self.center_line.start, self.center_line.direction)
-        plane1: Plane = Plane(self.center_line.end, self.center_line.direction)
-        points0: list[list[float]] = []
-        points1: list[list[float]] = []
-        for i in range(len(polygon.points)):
-            line: Line = Line(polygon.points[i], polygon.points[i] + self.center_line.vector)
-            result0: Optional[list[float]] = intersection_line_plane(line, plane0)
-            result1: Optional[list[float]] = intersection_line_plane(line, plane1)
-            if not result0 or not result1:
-                raise ValueError("The line does not intersect the plane")
-            points0.append(result0)
-            points1.append(result1)
-        polygon0 = Polygon(points0)
-        polygon1 = Polygon(points1)
-
-        from compas.geometry import earclip_polygon
-        from compas.itertools import pairwise
-
-        offset: int = len(polygon0)
-        vertices: list[Point] = polygon0.points + polygon1.points  # type: ignore
-
-        triangles: list[list[int]] = earclip_polygon(Polygon(polygon0.points))
-        top_faces: list[list[int]] = []
-        bottom_faces: list[list[int]] = []
-        for i in range(len(triangles)):
-            # Create bottom faces with original winding
-            bottom_faces.append(triangles[i])
-            # Create top faces with consistent winding and offset
-            top_face = [triangles[i][0] + offset, triangles[i][2] + offset, triangles[i][1] + offset]
-            top_faces.append(top_face)
-
-        faces: list[list[int]] = bottom_faces + top_faces
-
-        # Create side faces with consistent winding
-        bottom: list[int] = list(range(offset))
-        top: list[int] = [i + offset for i in bottom]
-        for (a, b), (c, d) in zip(pairwise(bottom + bottom[:1]), pairwise(top + top[:1])):
-            faces.append([a, c, d, b])  # Changed winding order for side faces
+    def _loft(self, polygon: Polygon, transformation: Optional[Transformation] = None) -> Mesh:
+        # The center line is the Z-axis from 0 to the length of the beam.
+        points0, points1 = extrude_points_z_numpy(polygon.points, 0.0, self.length)
+        faces: list[list[int]] = [list(face) for face in _loft_faces(tuple((x, y) for x, y, _ in points0.tolist()))]
+        points: np.ndarray = np.vstack((points0, points1))
+        if transformation is not None:
+            # The vertices are transformed in one matrix product before the mesh is built.
+            points = transform_points_numpy(points, transformation)
+        vertices: list[list[float]] = points.tolist()
         mesh: Mesh = Mesh.from_vertices_and_faces(vertices, faces)
         return mesh
 
@@ -374,37 +425,51 @@ class BeamProfileElement(BeamElement):
         if self.features:
             shape = self.shape if self.shape else self._loft(self.section)
             mid_point: Point = self.center_line.midpoint
+            scale: Scale = Scale.from_factors([1, 1, 2], Frame(mid_point, [1, 0, 0], [0, 1, 0]))
             cut_meshes: list[Mesh] = []
             for feature in self.features:
                 if isinstance(feature, BeamFeature):
-                    cut_mesh: Mesh = self._loft(feature.section)
-                    frame = Frame(mid_point, [1, 0, 0], [0, 1, 0])
-                    cut_mesh.transform(Scale.from_factors([1, 1, 2], frame))
+                    cut_mesh: Mesh = self._loft(feature.section, scale)
                     cut_meshes.append(cut_mesh)
 
-            from compas.geometry import boolean_intersection_mesh_mesh
-
+            # The triangulated vertices and faces are passed from one boolean to the next, the mesh is only built once at the end.
+            A = shape.to_vertices_and_faces(triangulated=True)
+            is_cut: bool = False
             for cut_mesh in cut_meshes:
-                A = shape.to_vertices_and_faces(triangulated=True)
                 B = cut_mesh.to_vertices_and_faces(triangulated=True)
 
                 V, F = boolean_intersection_mesh_mesh(A, B)
-                shape: Mesh = Mesh.from_vertices_and_faces(V, F) if len(V) > 0 and len(F) > 0 else shape
+                if len(V) > 0 and len(F) > 0:
+                    A = (V, F)
+                    is_cut = True
 
-            return shape
+            return Mesh.from_vertices_and_faces(*A) if is_cut else shape
 
         else:
             mesh: Mesh = self._loft(self.section)
             return mesh
 
+    def compute_modelpoints(self) -> np.ndarray:
+        """Compute the vertex coordinates of the model geometry.
+        The coordinates are cached until the model geometry is recomputed.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The XYZ coordinates of the vertices, as an array of shape (V, 3).
+
+        """
+        self._modelpoints = cached_mesh_points_numpy(self._modelpoints, self.modelgeometry)  # type: ignore
+        return self._modelpoints[1]
+
     @property
     def length(self) -> float:
         return self._length
 
     @length.setter
+    @reset_computed
     def length(self, length: float):
         self._length = length
-        self.compute_elementgeometry()
 
     @property
     def center_line(self) -> Line:
@@ -418,10 +483,10 @@ class BeamProfileElement(BeamElement):
         distance : float
             The distance to extend the beam.
         """
-        self.length = self.length + distance * 2
+        # The transformation setter resets the computed geometry, so the length is stored directly.
+        self._length = self.length + distance * 2
         xform: Transformation = Translation.from_vector([0, 0, -distance])
         self.transformation = self.transformation * xform
-        self.compute_elementgeometry()
 
     def compute_aabb(self, inflate: Optional[bool] = None) -> Box:
         """Compute the axis-aligned bounding box of the element.
@@ -437,11 +502,7 @@ class BeamProfileElement(BeamElement):
             The axis-aligned bounding box.
         """
 
-        box = self.modelgeometry.aabb()
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = aabb_from_points_numpy(self.compute_modelpoints(), inflate)
         self._aabb = box
         return box
 
@@ -458,11 +519,8 @@ class BeamProfileElement(BeamElement):
         :class:`compas.geometry.Box`
             The oriented bounding box.
         """
-        box = self.modelgeometry.obb()
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = obb_from_points_numpy(self.compute_modelpoints())
+        box = inflate_box(box, inflate)
         self._obb = box
         return box
 
@@ -532,7 +590,7 @@ class BeamProfileElement(BeamElement):
         _step_height_left = min(_step_height_left, height)
         _step_height_right = min(_step_height_right, height)
 
-        polygon = Polygon(
+        points: np.ndarray = np.array(
             [
                 [_width * 0.5, -_height * 0.5, 0],
                 [-_width * 0.5, -_height * 0.5, 0],
@@ -542,12 +600,15 @@ class BeamProfileElement(BeamElement):
                 [_width * 0.5 - _step_width_right, _height * 0.5, 0],
                 [_width * 0.5 - _step_width_right, -_height * 0.5 + _step_height_right, 0],
                 [_width * 0.5, -_height * 0.5 + _step_height_right, 0],
-            ]
+            ],
+            dtype=float,
         )
 
         if inverted:
-            mirror_line: Line = Line([0, 0, 0], [1, 0, 0])
-            polygon = Polygon(mirror_points_line(polygon.points, mirror_line))
+            # Mirror the section about the X-axis of the XY plane.
+            points[:, 1] *= -1
+
+        polygon = Polygon(points.tolist())
 
         return cls(polygon, abs(length), is_support, transformation, features, name)
 
@@ -649,10 +710,9 @@ class BeamShapeElement(BeamElement):
         return self._length
 
     @length.setter
+    @reset_computed
     def length(self, length: float):
         self._length = length
-        self.section = Polygon(list(self.points))
-        self.compute_elementgeometry()
 
     @property
     def center_line(self) -> Line:
@@ -666,10 +726,10 @@ class BeamShapeElement(BeamElement):
         distance : float
             The distance to extend the beam.
         """
-        self.length = self.length + distance * 2
+        # The transformation setter resets the computed geometry, so the length is stored directly.
+        self._length = self.length + distance * 2
         xform: Transformation = Translation.from_vector([0, 0, -distance])
         self.transformation = self.transformation * xform
-        self.compute_elementgeometry()
 
     def compute_aabb(self, inflate: Optional[bool] = None) -> Box:
         """Compute the axis-aligned bounding box of the element.
@@ -685,11 +745,8 @@ class BeamShapeElement(BeamElement):
             The axis-aligned bounding box.
         """
 
-        box = self.modelgeometry.aabb()
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = aabb_numpy(self.modelgeometry)
+        box = inflate_box(box, inflate)
         self._aabb = box
         return box
 
@@ -707,10 +764,7 @@ class BeamShapeElement(BeamElement):
             The oriented bounding box.
         """
         box = self.modelgeometry.oobb()
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = inflate_box(box, inflate)
         self._obb = box
         return box
 
@@ -1,5 +1,7 @@
 from typing import Optional
 
+import numpy as np
+
 # from compas.geometry import trimesh_slice
 from compas_model.elements import Element
 from compas_model.elements import Feature
@@ -14,8 +16,22 @@ from compas.geometry import Transformation
 from compas.geometry import boolean_difference_mesh_mesh
 from compas.geometry import boolean_intersection_mesh_mesh
 from compas.geometry import boolean_union_mesh_mesh
-from compas.geometry import convex_hull_numpy
-from compas.geometry import oriented_bounding_box_numpy
+from compas_grid._geometry import aabb_from_points_numpy
+from compas_grid._geometry import cached_mesh_points_numpy
+from compas_grid._geometry import convex_hull_mesh_numpy
+from compas_grid._geometry import inflate_box
+from compas_grid._geometry import obb_from_points_numpy
+
+
+def _flatten_meshes(others: tuple) -> list[Mesh]:
+    # The boolean operations accept the other meshes as separate arguments or as a single list.
+    meshes: list[Mesh] = []
+    for other in others:
+        if isinstance(other, (list, tuple)):
+            meshes.extend(other)
+        else:
+            meshes.append(other)
+    return meshes
 
 
 class BlockMesh(Mesh):
@@ -23,6 +39,7 @@ class BlockMesh(Mesh):
 
     def boolean_difference(self, *others: "BlockMesh") -> "BlockMesh":
         """Return the boolean difference of this mesh and one or more other meshes.
+        The other meshes are united first, so this mesh is subtracted from only once.
 
         Parameters
         ----------
@@ -34,12 +51,13 @@ class BlockMesh(Mesh):
         :class:`BlockMesh`
 
         """
-        A = self.to_vertices_and_faces()
-        if not isinstance(others, list):
-            others = [others]
-        for mesh in others:
-            B = mesh.to_vertices_and_faces()
-            A = boolean_difference_mesh_mesh(A, B)
+        meshes: list[Mesh] = _flatten_meshes(others)
+        if not meshes:
+            return self.copy()
+        B = meshes[0].to_vertices_and_faces()
+        for mesh in meshes[1:]:
+            B = boolean_union_mesh_mesh(B, mesh.to_vertices_and_faces())
+        A = boolean_difference_mesh_mesh(self.to_vertices_and_faces(), B)
         return type(self).from_vertices_and_faces(*A)
 
     def boolean_intersection(self, *others: "BlockMesh") -> "BlockMesh":
@@ -56,9 +74,7 @@ class BlockMesh(Mesh):
 
         """
         A = self.to_vertices_and_faces()
-        if not isinstance(others, list):
-            others = [others]
-        for mesh in others:
+        for mesh in _flatten_meshes(others):
             B = mesh.to_vertices_and_faces()
             A = boolean_intersection_mesh_mesh(A, B)
         return type(self).from_vertices_and_faces(*A)
@@ -77,9 +93,7 @@ class BlockMesh(Mesh):
 
         """
         A = self.to_vertices_and_faces()
-        if not isinstance(others, list):
-            others = [others]
-        for mesh in others:
+        for mesh in _flatten_meshes(others):
             B = mesh.to_vertices_and_faces()
             A = boolean_union_mesh_mesh(A, B)
         return type(self).from_vertices_and_faces(*A)
@@ -151,6 +165,7 @@ class BlockElement(Element):
 
         self.shape = shape
         self.is_support = is_support
+        self._modelpoints: Optional[tuple[Mesh, np.ndarray]] = None
 
     # =============================================================================
     # Constructors
@@ -213,31 +228,32 @@ class BlockElement(Element):
         self._geometry = geometry
         return geometry
 
+    def compute_modelpoints(self) -> np.ndarray:
+        """Compute the vertex coordinates of the model geometry.
+        The coordinates are cached until the model geometry is recomputed.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The XYZ coordinates of the vertices, as an array of shape (V, 3).
+
+        """
+        self._modelpoints = cached_mesh_points_numpy(self._modelpoints, self.modelgeometry)  # type: ignore
+        return self._modelpoints[1]
+
     def compute_aabb(self, inflate: Optional[bool] = None) -> Box:
-        points = self.modelgeometry.vertices_attributes("xyz")
-        box = Box.from_points(points)
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = aabb_from_points_numpy(self.compute_modelpoints(), inflate)
         self._aabb = box
         return box
 
     def compute_obb(self, inflate: Optional[bool] = None) -> Box:
-        points = self.modelgeometry.vertices_attributes("xyz")
-        box = Box.from_bounding_box(oriented_bounding_box_numpy(points))
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = obb_from_points_numpy(self.compute_modelpoints())
+        box = inflate_box(box, inflate)
         self._obb = box
         return box
 
     def compute_collision_mesh(self) -> Mesh:
-        points = self.vertices_attributes("xyz")
-        vertices, faces = convex_hull_numpy(points)
-        vertices = [points[index] for index in vertices]
-        return Mesh.from_vertices_and_faces(vertices, faces)
+        return convex_hull_mesh_numpy(self.compute_modelpoints())
 
     def compute_point(self) -> Point:
         return Point(*self.modelgeometry.centroid())
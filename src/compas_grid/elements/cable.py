@@ -1,21 +1,29 @@
 from typing import TYPE_CHECKING
 from typing import Optional
 
+import numpy as np
 from compas_model.elements.element import Element
 from compas_model.elements.element import Feature
+from compas_model.elements.element import reset_computed
 from compas_model.interactions import BooleanModifier
 
 from compas.datastructures import Mesh
 from compas.geometry import Box
 from compas.geometry import Line
-from compas.geometry import Plane
 from compas.geometry import Point
 from compas.geometry import Polygon
 from compas.geometry import Transformation
 from compas.geometry import Translation
-from compas.geometry import bounding_box
-from compas.geometry import intersection_line_plane
-from compas.geometry import oriented_bounding_box
+from compas.tolerance import TOL
+from compas_grid._geometry import aabb_from_points_numpy
+from compas_grid._geometry import cached_mesh_points_numpy
+from compas_grid._geometry import extrude_points_numpy
+from compas_grid._geometry import extrude_points_z_numpy
+from compas_grid._geometry import face_polygons_numpy
+from compas_grid._geometry import inflate_box
+from compas_grid._geometry import mesh_transformed_numpy
+from compas_grid._geometry import obb_from_points_numpy
+from compas_grid._geometry import prism_faces
 
 if TYPE_CHECKING:
     from compas_model.elements import BeamElement
@@ -103,16 +111,22 @@ class CableElement(Element):
         self.axis: Line = Line([0, 0, 0], [0, 0, self._length])
         self.section: Polygon = Polygon.from_sides_and_radius_xy(sides, radius)
         self.polygon_bottom, self.polygon_top = self.compute_top_and_bottom_polygons()
+        self._modelpoints: Optional[tuple[Mesh, np.ndarray]] = None
+        self._face_polygons: Optional[tuple[Mesh, list[Polygon]]] = None
 
     @property
     def face_polygons(self) -> list[Polygon]:
-        return [self.modelgeometry.face_polygon(face) for face in self.modelgeometry.faces()]  # type: ignore
+        modelgeometry: Mesh = self.modelgeometry  # type: ignore
+        if self._face_polygons is None or self._face_polygons[0] is not modelgeometry:
+            self._face_polygons = (modelgeometry, face_polygons_numpy(modelgeometry))
+        return self._face_polygons[1]
 
     @property
     def length(self) -> float:
         return self._length
 
     @length.setter
+    @reset_computed
     def length(self, length: float):
         self._length = length
         self.axis: Line = Line([0, 0, 0], [0, 0, self._length])
@@ -126,19 +140,25 @@ class CableElement(Element):
         tuple[:class:`compas.geometry.Polygon`, :class:`compas.geometry.Polygon`]
         """
 
-        plane0: Plane = Plane(self.axis.start, self.axis.direction)
-        plane1: Plane = Plane(self.axis.end, self.axis.direction)
-        points0: list[list[float]] = []
-        points1: list[list[float]] = []
-        for i in range(len(self.section.points)):
-            line: Line = Line(self.section.points[i], self.section.points[i] + self.axis.vector)
-            result0: Optional[list[float]] = intersection_line_plane(line, plane0)
-            result1: Optional[list[float]] = intersection_line_plane(line, plane1)
-            if not result0 or not result1:
-                raise ValueError("The line does not intersect the plane")
-            points0.append(result0)
-            points1.append(result1)
-        return Polygon(points0), Polygon(points1)
+        if TOL.is_zero(self.axis.vector[0]) and TOL.is_zero(self.axis.vector[1]):
+            bottom, top = extrude_points_z_numpy(self.section.points, self.axis.start[2], self.axis.end[2])
+            return Polygon(bottom.tolist()), Polygon(top.tolist())
+
+        bottom, top = extrude_points_numpy(self.section.points, self.axis.start, self.axis.end)
+        return Polygon(bottom.tolist()), Polygon(top.tolist())
+
+    def compute_modelpoints(self) -> np.ndarray:
+        """Compute the vertex coordinates of the model geometry.
+        The coordinates are cached until the model geometry is recomputed.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The XYZ coordinates of the vertices, as an array of shape (V, 3).
+
+        """
+        self._modelpoints = cached_mesh_points_numpy(self._modelpoints, self.modelgeometry)  # type: ignore
+        return self._modelpoints[1]
 
     def compute_elementgeometry(self) -> Mesh:
         """Compute the shape of the Cable from the given polygons.
@@ -149,16 +169,9 @@ class CableElement(Element):
         :class:`compas.datastructures.Mesh`
 
         """
-        from compas.geometry import Point
-        from compas.itertools import pairwise
-
         offset: int = len(self.polygon_bottom)
         vertices: list[Point] = self.polygon_bottom.points + self.polygon_top.points  # type: ignore
-        bottom: list[int] = list(range(offset))
-        top: list[int] = [i + offset for i in bottom]
-        faces: list[list[int]] = [bottom[::-1], top]
-        for (a, b), (c, d) in zip(pairwise(bottom + bottom[:1]), pairwise(top + top[:1])):
-            faces.append([a, b, d, c])
+        faces: list[list[int]] = prism_faces(offset)
         mesh: Mesh = Mesh.from_vertices_and_faces(vertices, faces)
         return mesh
 
@@ -179,12 +192,7 @@ class CableElement(Element):
         :class:`compas.geometry.Box`
             The axis-aligned bounding box.
         """
-        points: list[list[float]] = self.modelgeometry.vertices_attributes("xyz")  # type: ignore
-        box: Box = Box.from_bounding_box(bounding_box(points))
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box: Box = aabb_from_points_numpy(self.compute_modelpoints(), inflate)
         return box
 
     def compute_obb(self, inflate: Optional[bool] = None) -> Box:
@@ -200,12 +208,8 @@ class CableElement(Element):
         :class:`compas.geometry.Box`
             The oriented bounding box.
         """
-        points: list[list[float]] = self.modelgeometry.vertices_attributes("xyz")  # type: ignore
-        box: Box = Box.from_bounding_box(oriented_bounding_box(points))
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box: Box = obb_from_points_numpy(self.compute_modelpoints())
+        box = inflate_box(box, inflate)
         return box
 
     def compute_collision_mesh(self) -> Mesh:
@@ -216,12 +220,7 @@ class CableElement(Element):
         :class:`compas.datastructures.Mesh`
             The collision mesh.
         """
-        from compas.geometry import convex_hull_numpy
-
-        points: list[list[float]] = self.modelgeometry.vertices_attributes("xyz")  # type: ignore
-        vertices, faces = convex_hull_numpy(points)
-        vertices = [points[index] for index in vertices]  # type: ignore
-        return Mesh.from_vertices_and_faces(vertices, faces)
+        return mesh_transformed_numpy(self.elementgeometry, self.modeltransformation)
 
     def extend(self, distance: float) -> None:
         """Extend the beam.
@@ -265,7 +264,7 @@ class CableElement(Element):
     def _add_modifier_with_beam(self, target_element: "BeamElement", type: str):
         # Scenario:
         # A cable applies boolean difference with a block geometry.
-        return BooleanModifier(self.elementgeometry.transformed(self.modeltransformation))
+        return BooleanModifier(mesh_transformed_numpy(self.elementgeometry, self.modeltransformation))
 
     def compute_point(self) -> Point:
         return Point(*self.aabb.frame.point)
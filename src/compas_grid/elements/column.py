@@ -1,18 +1,23 @@
 from typing import Optional
 from typing import Type
 
+import numpy as np
 from compas_model.elements import BeamElement
 from compas_model.elements import Element
 from compas_model.elements.element import Feature
+from compas_model.elements.element import reset_computed
 from compas_model.interactions import BooleanModifier
 from compas_model.interactions import Modifier
 
 from compas.datastructures import Mesh
 from compas.geometry import Box
-from compas.geometry import Frame
 from compas.geometry import Line
 from compas.geometry import Point
 from compas.geometry import Transformation
+from compas.geometry import transform_points_numpy
+from compas_grid._geometry import aabb_from_points_numpy
+from compas_grid._geometry import inflate_box
+from compas_grid._geometry import mesh_transformed_numpy
 
 
 class ColumnFeature(Feature):
@@ -73,7 +78,7 @@ class ColumnElement(Element):
     ) -> "ColumnElement":
         super().__init__(transformation=transformation, features=features, name=name)
         self._box = Box.from_width_height_depth(width, length, height)
-        self._box.frame = Frame(point=[0, 0, self._box.zsize / 2], xaxis=[1, 0, 0], yaxis=[0, 1, 0])
+        self._box.frame.point = [0, 0, self._box.zsize / 2]
 
     @property
     def box(self) -> Box:
@@ -84,6 +89,7 @@ class ColumnElement(Element):
         return self.box.xsize
 
     @width.setter
+    @reset_computed
     def width(self, width: float):
         self.box.xsize = width
 
@@ -92,6 +98,7 @@ class ColumnElement(Element):
         return self.box.ysize
 
     @height.setter
+    @reset_computed
     def height(self, height: float):
         self.box.ysize = height
 
@@ -100,9 +107,10 @@ class ColumnElement(Element):
         return self.box.zsize
 
     @length.setter
+    @reset_computed
     def length(self, length: float):
         self.box.zsize = length
-        self.box.frame = Frame(point=[0, 0, self.box.zsize / 2], xaxis=[1, 0, 0], yaxis=[0, 1, 0])
+        self.box.frame.point = [0, 0, self.box.zsize / 2]
 
     @property
     def center_line(self) -> Line:
@@ -121,6 +129,7 @@ class ColumnElement(Element):
         """
         return self.box.to_mesh()
 
+    @reset_computed
     def extend(self, distance: float) -> None:
         """Extend the beam.
 
@@ -131,7 +140,7 @@ class ColumnElement(Element):
         """
 
         self.box.zsize = self.length + distance * 2
-        self.box.frame = Frame(point=[0, 0, self.box.zsize / 2], xaxis=[1, 0, 0], yaxis=[0, 1, 0])
+        self.box.frame.point = [0, 0, self.box.zsize / 2]
 
     def compute_aabb(self, inflate: Optional[bool] = None) -> Box:
         """Compute the axis-aligned bounding box of the element.
@@ -147,12 +156,8 @@ class ColumnElement(Element):
             The axis-aligned bounding box.
         """
 
-        box = self.box.transformed(self.modeltransformation)
-        box = Box.from_bounding_box(box.points)
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        points: np.ndarray = transform_points_numpy(self.box.points, self.modeltransformation)
+        box = aabb_from_points_numpy(points, inflate)
         self._aabb = box
         return box
 
@@ -170,10 +175,7 @@ class ColumnElement(Element):
             The oriented bounding box.
         """
         box = self._box.transformed(self.modeltransformation)
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = inflate_box(box, inflate)
         self._obb = box
         return box
 
@@ -185,7 +187,7 @@ class ColumnElement(Element):
         :class:`compas.datastructures.Mesh`
             The collision mesh.
         """
-        return self.modelgeometry.to_mesh()
+        return mesh_transformed_numpy(self.elementgeometry, self.modeltransformation)
 
     def compute_point(self) -> Point:
         """Compute the reference point of the column from the centroid of its geometry.
@@ -203,4 +205,4 @@ class ColumnElement(Element):
 
     def _add_modifier_with_beam(self, target_element: "BeamElement", modifier_type: Type[Modifier] = None, **kwargs) -> Modifier:
         # This method applies the boolean modifier for the pair of column and a beam.
-        return BooleanModifier(self.elementgeometry.transformed(self.modeltransformation))
+        return BooleanModifier(mesh_transformed_numpy(self.elementgeometry, self.modeltransformation))
@@ -1,7 +1,11 @@
 from enum import Enum
+from functools import lru_cache
+from math import ceil
+from threading import Lock
 from typing import TYPE_CHECKING
 from typing import Optional
 
+import numpy as np
 from compas_model.elements.element import Element
 from compas_model.interactions import SlicerModifier
 
@@ -13,8 +17,13 @@ from compas.geometry import Point
 from compas.geometry import Polygon
 from compas.geometry import Transformation
 from compas.geometry import Vector
-from compas.geometry import bounding_box
-from compas.geometry import oriented_bounding_box
+from compas_grid._geometry import aabb_from_points_numpy
+from compas_grid._geometry import cached_mesh_points_numpy
+from compas_grid._geometry import convex_hull_mesh_numpy
+from compas_grid._geometry import face_polygons_numpy
+from compas_grid._geometry import faces_packed_numpy
+from compas_grid._geometry import inflate_box
+from compas_grid._geometry import obb_from_points_numpy
 
 if TYPE_CHECKING:
     from compas_grid.elements import BeamElement
@@ -113,8 +122,8 @@ class CrossBlockShape:
     """
 
     _instance = None
-    _generated_meshes = {}
     _last_mesh = None
+    _lock = Lock()  # The shared instance stores the dimensions of the last shape, so shapes are generated one at a time.
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -131,15 +140,12 @@ class CrossBlockShape:
         length: float = 300,
         offset: float = 210,
     ):
-        if not hasattr(self, "_initialized"):
-            self._width = width
-            self._height = height
-            self._length = length
-            self._offset = offset
+        self._width = width
+        self._height = height
+        self._length = length
+        self._offset = offset
         rules = self._generate_rules(v, e, f)
-        self._generated_meshes[rules] = self._generate_mesh(rules)
-        self._last_mesh = self._generated_meshes[rules]
-        self._initialized = True
+        self._last_mesh = self._generate_mesh(rules, width, height, length, offset)
 
     def _generate_rules(self, v: dict[Point], e: list[tuple[int, int]], f: list[list[int]]) -> list[bool]:
         """
@@ -201,15 +207,27 @@ class CrossBlockShape:
 
         return tuple(rules)
 
-    def _generate_mesh(self, rules: tuple[bool]) -> Mesh:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _generate_mesh(rules: tuple[bool], width: float, height: float, length: float, offset: float) -> Mesh:
         """
         Generate mesh based on the rules.
+        Meshes are generated once per combination of rules and dimensions, and shared by all column heads.
+        The most recently used meshes are kept, so that parametric studies over many dimensions do not grow the cache without bound.
 
         Parameters
         ----------
 
         rules : tuple
             The generated rules that corresponds to world direction using CardinalDirections enumerator.
+        width : float
+            The width of the column head.
+        height : float
+            The height of the column head.
+        length : float
+            The length of the column head.
+        offset : float
+            The offset of the column head.
 
         Returns
         -------
@@ -218,8 +236,7 @@ class CrossBlockShape:
 
         """
 
-        if rules in self._generated_meshes:
-            return self._generated_meshes[rules]
+        rules: list[bool] = list(rules)
 
         ###########################################################################################
         # Generate mesh based on the rules.
@@ -227,24 +244,24 @@ class CrossBlockShape:
 
         vertices: list[Point] = [
             # Outer ring
-            Point(self._width, self._height + self._offset, -self._length),  # 0
-            Point(-self._width, self._height + self._offset, -self._length),  # 1
-            Point(-self._width - self._offset, self._height, -self._length),  # 2
-            Point(-self._width - self._offset, -self._height, -self._length),  # 3
-            Point(-self._width, -self._height - self._offset, -self._length),  # 4
-            Point(self._width, -self._height - self._offset, -self._length),  # 5
-            Point(self._width + self._offset, -self._height, -self._length),  # 6
-            Point(self._width + self._offset, self._height, -self._length),  # 7
+            Point(width, height + offset, -length),  # 0
+            Point(-width, height + offset, -length),  # 1
+            Point(-width - offset, height, -length),  # 2
+            Point(-width - offset, -height, -length),  # 3
+            Point(-width, -height - offset, -length),  # 4
+            Point(width, -height - offset, -length),  # 5
+            Point(width + offset, -height, -length),  # 6
+            Point(width + offset, height, -length),  # 7
             # Inner quad
-            Point(self._width, self._height, -self._length),  # 8
-            Point(-self._width, self._height, -self._length),  # 9
-            Point(-self._width, -self._height, -self._length),  # 10
-            Point(self._width, -self._height, -self._length),  # 11
+            Point(width, height, -length),  # 8
+            Point(-width, height, -length),  # 9
+            Point(-width, -height, -length),  # 10
+            Point(width, -height, -length),  # 11
             # Top quad
-            Point(self._width, self._height, 0),  # 12
-            Point(-self._width, self._height, 0),  # 13
-            Point(-self._width, -self._height, 0),  # 14
-            Point(self._width, -self._height, 0),  # 15
+            Point(width, height, 0),  # 12
+            Point(-width, height, 0),  # 13
+            Point(-width, -height, 0),  # 14
+            Point(width, -height, 0),  # 15
         ]
 
         # Check if two floor plate has two beams else plate cannot be connected to column head.
@@ -293,8 +310,6 @@ class CrossBlockShape:
             mesh.add_face([7, 0, 12], attr_dict={"direction": CardinalDirections.NORTH_EAST})
 
         # Outer ring vertical triangle faces
-        from math import ceil
-
         for i in range(8):
             if rules[i]:
                 continue
@@ -343,11 +358,12 @@ class ColumnHeadCrossElement(ColumnHeadElement):
 
     Parameters
     ----------
-    v : dict[int, Point]
+    v : dict[int, Point], optional
         The points, first one is always the origin.
-    e : list[tuple[int, int]]
+        Defaults to a full cross of four directions around the origin.
+    e : list[tuple[int, int]], optional
         Edges start from v0 between points v0-v1, v0-v2 and so on.
-    f : list[list[int]]
+    f : list[list[int]], optional
         Faces between points v0-v1-v2-v3 and so on. If face vertices form already given edges, a triangle mesh face is formed.
     width : float
         The width of the column head.
@@ -411,20 +427,9 @@ class ColumnHeadCrossElement(ColumnHeadElement):
 
     def __init__(
         self,
-        v: dict[int, Point] = {
-            7: Point(0, 0, 0),
-            5: Point(-1, 0, 0),
-            6: Point(0, 1, 0),
-            8: Point(0, -1, 0),
-            2: Point(1, 0, 0),
-        },
-        e: list[tuple[int, int]] = [
-            (7, 5),
-            (7, 6),
-            (7, 8),
-            (7, 2),
-        ],
-        f: list[list[int]] = [[5, 7, 6, 10]],
+        v: Optional[dict[int, Point]] = None,
+        e: Optional[list[tuple[int, int]]] = None,
+        f: Optional[list[list[int]]] = None,
         width=150,
         height=150,
         length=300,
@@ -435,28 +440,63 @@ class ColumnHeadCrossElement(ColumnHeadElement):
     ) -> "ColumnHeadCrossElement":
         super().__init__(transformation=transformation, name=name)
         self.is_support = is_support
-        self.v = v
-        self.e = e
-        self.f = f
+        self.v = v if v is not None else {7: Point(0, 0, 0), 5: Point(-1, 0, 0), 6: Point(0, 1, 0), 8: Point(0, -1, 0), 2: Point(1, 0, 0)}
+        self.e = e if e is not None else [(7, 5), (7, 6), (7, 8), (7, 2)]
+        self.f = f if f is not None else [[5, 7, 6, 10]]
         self.width = width
         self.height = height
         self.length = length
         self.offset = offset
+        self._modelpoints: Optional[tuple[Mesh, np.ndarray]] = None
+        self._face_polygons: Optional[tuple[Mesh, list[Polygon]]] = None
+        self._face_polygons_packed: Optional[tuple[Mesh, np.ndarray]] = None
 
     @property
     def face_polygons(self) -> list[Polygon]:
-        return [self.modelgeometry.face_polygon(face) for face in self.modelgeometry.faces()]  # type: ignore
+        modelgeometry: Mesh = self.modelgeometry  # type: ignore
+        if self._face_polygons is None or self._face_polygons[0] is not modelgeometry:
+            self._face_polygons = (modelgeometry, face_polygons_numpy(modelgeometry))
+        return self._face_polygons[1]
+
+    @property
+    def face_polygons_packed(self) -> np.ndarray:
+        """The face polygons of the model geometry as a single float32 array of shape (F, maxV, 3).
+        Faces with fewer than maxV vertices are padded with NaN.
+        The array is read-only and cached until the model geometry is recomputed.
+        """
+        modelgeometry: Mesh = self.modelgeometry  # type: ignore
+        if self._face_polygons_packed is None or self._face_polygons_packed[0] is not modelgeometry:
+            packed: np.ndarray = faces_packed_numpy(*modelgeometry.to_vertices_and_faces())
+            packed.flags.writeable = False
+            self._face_polygons_packed = (modelgeometry, packed)
+        return self._face_polygons_packed[1]
 
     def compute_elementgeometry(self) -> Mesh:
         """Compute the shape of the column head.
+        The mesh is shared by all column heads with the same directions and dimensions, and should not be modified.
+        The model geometry is a transformed copy of it.
 
         Returns
         -------
         :class:`compas.datastructures.Mesh`
 
         """
-        column_head_cross_shape: CrossBlockShape = CrossBlockShape(self.v, self.e, self.f, self.width, self.height, self.length, self.offset)
-        return column_head_cross_shape.mesh.copy()  # Copy because the meshes are created only once.
+        with CrossBlockShape._lock:
+            column_head_cross_shape: CrossBlockShape = CrossBlockShape(self.v, self.e, self.f, self.width, self.height, self.length, self.offset)
+            return column_head_cross_shape.mesh
+
+    def compute_modelpoints(self) -> np.ndarray:
+        """Compute the vertex coordinates of the model geometry.
+        The coordinates are cached until the model geometry is recomputed.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The XYZ coordinates of the vertices, as an array of shape (V, 3).
+
+        """
+        self._modelpoints = cached_mesh_points_numpy(self._modelpoints, self.modelgeometry)  # type: ignore
+        return self._modelpoints[1]
 
     # =============================================================================
     # Implementations of abstract methods
@@ -475,11 +515,7 @@ class ColumnHeadCrossElement(ColumnHeadElement):
         :class:`compas.geometry.Box`
             The axis-aligned bounding box.
         """
-        points: list[list[float]] = self.modelgeometry.vertices_attributes("xyz")  # type: ignore
-        box: Box = Box.from_bounding_box(bounding_box(points))
-        box.xsize += inflate
-        box.ysize += inflate
-        box.zsize += inflate
+        box: Box = aabb_from_points_numpy(self.compute_modelpoints(), inflate)
         return box
 
     def compute_obb(self, inflate: Optional[bool] = None) -> Box:
@@ -495,11 +531,8 @@ class ColumnHeadCrossElement(ColumnHeadElement):
         :class:`compas.geometry.Box`
             The oriented bounding box.
         """
-        points: list[list[float]] = self.modelgeometry.vertices_attributes("xyz")  # type: ignore
-        box: Box = Box.from_bounding_box(oriented_bounding_box(points))
-        box.xsize += inflate
-        box.ysize += inflate
-        box.zsize += inflate
+        box: Box = obb_from_points_numpy(self.compute_modelpoints())
+        box = inflate_box(box, inflate)
         return box
 
     def compute_collision_mesh(self) -> Mesh:
@@ -510,12 +543,7 @@ class ColumnHeadCrossElement(ColumnHeadElement):
         :class:`compas.datastructures.Mesh`
             The collision mesh.
         """
-        from compas.geometry import convex_hull_numpy
-
-        points: list[list[float]] = self.modelgeometry.vertices_attributes("xyz")  # type: ignore
-        vertices, faces = convex_hull_numpy(points)
-        vertices = [points[index] for index in vertices]  # type: ignore
-        return Mesh.from_vertices_and_faces(vertices, faces)
+        return convex_hull_mesh_numpy(self.compute_modelpoints())
 
     def add_modifier(self, target_element: Element, type: str = ""):
         """Computes the contact interaction of the geometry of the elements that is used in the model's add_contact method.
@@ -8,6 +8,8 @@ from compas.datastructures import Mesh
 from compas.geometry import Box
 from compas.geometry import Brep
 from compas.geometry import Transformation
+from compas_grid._geometry import aabb_numpy
+from compas_grid._geometry import inflate_box
 
 
 class CutFeature(Feature):
@@ -91,11 +93,8 @@ class CutElement(Element):
             The axis-aligned bounding box.
         """
 
-        box = self.modelgeometry.aabb()
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = aabb_numpy(self.modelgeometry)
+        box = inflate_box(box, inflate)
         self._aabb = box
         return box
 
@@ -113,10 +112,7 @@ class CutElement(Element):
             The oriented bounding box.
         """
         box = self.modelgeometry.oobb()
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = inflate_box(box, inflate)
         self._obb = box
         return box
 
@@ -1,15 +1,99 @@
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 from compas_model.elements.element import Element
 from compas_model.elements.element import Feature
 
 from compas.datastructures import Mesh
 from compas.geometry import Box
+from compas.geometry import Frame
 from compas.geometry import Point
 from compas.geometry import Polygon
 from compas.geometry import Transformation
-from compas.geometry import Vector
-from compas.itertools import pairwise
+from compas_grid._geometry import aabb_from_points_numpy
+from compas_grid._geometry import cached_mesh_points_numpy
+from compas_grid._geometry import face_polygons_numpy
+from compas_grid._geometry import faces_packed_numpy
+from compas_grid._geometry import inflate_box
+from compas_grid._geometry import obb_from_points_numpy
+from compas_grid._geometry import prism_faces
+
+
+def _offset_polygons(points: np.ndarray, thickness: float) -> tuple[np.ndarray, np.ndarray]:
+    """Offset a stack of polygons with the same number of points along their normals.
+
+    Parameters
+    ----------
+    points : :class:`numpy.ndarray`
+        The points of the polygons, as an array of shape (B, N, 3).
+    thickness : float
+        The offset thickness.
+
+    Returns
+    -------
+    tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`]
+        The bottom and top points of the polygons, each as an array of shape (B, N, 3).
+
+    """
+    # Same normal as :func:`compas.geometry.normal_polygon`, computed for all polygons at once.
+    vectors: np.ndarray = points - points.mean(axis=1, keepdims=True)
+    normals: np.ndarray = np.cross(np.roll(vectors, 1, axis=1), vectors).sum(axis=1)
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = normals[:, np.newaxis, :]
+    return points + normals * (0.0 * thickness), points + normals * (-1.0 * thickness)
+
+
+@lru_cache(maxsize=1024)
+def _offset_polygon(points: tuple[tuple[float, float, float], ...], thickness: float) -> tuple[tuple, tuple]:
+    """Offset a single polygon along its normal, memoized on the polygon coordinates and the thickness.
+    Plates are positioned by their transformation, so many plates of a model share the same local polygon.
+
+    Parameters
+    ----------
+    points : tuple[tuple[float, float, float], ...]
+        The points of the polygon.
+    thickness : float
+        The offset thickness.
+
+    Returns
+    -------
+    tuple[tuple, tuple]
+        The bottom and top points of the polygon.
+
+    """
+    bottom, top = _offset_polygons(np.asarray([points], dtype=float), thickness)
+    return tuple(map(tuple, bottom[0].tolist())), tuple(map(tuple, top[0].tolist()))
+
+
+def _rectangle_box(points: np.ndarray, thickness: float) -> Optional[Box]:
+    """Construct the oriented bounding box of a plate analytically if its polygon is a rectangle.
+
+    Parameters
+    ----------
+    points : :class:`numpy.ndarray`
+        The points of the polygon, as an array of shape (N, 3).
+    thickness : float
+        The offset thickness.
+
+    Returns
+    -------
+    :class:`compas.geometry.Box` | None
+        The box aligned with the sides of the rectangle, or None if the polygon is not a rectangle.
+
+    """
+    if len(points) != 4:
+        return None
+    xaxis: np.ndarray = points[1] - points[0]
+    yaxis: np.ndarray = points[3] - points[0]
+    if not np.allclose(points[0] + xaxis + yaxis, points[2]) or not np.isclose(xaxis.dot(yaxis), 0.0):
+        return None
+    # The plate is extruded against the polygon normal, which is the z-axis of the rectangle frame.
+    normal: np.ndarray = np.cross(xaxis, yaxis)
+    normal /= np.linalg.norm(normal)
+    center: np.ndarray = points.mean(axis=0) - normal * (0.5 * thickness)
+    frame: Frame = Frame(center.tolist(), xaxis.tolist(), yaxis.tolist())
+    return Box(float(np.linalg.norm(xaxis)), float(np.linalg.norm(yaxis)), thickness, frame=frame)
 
 
 class PlateFeature(Feature):
@@ -68,15 +152,55 @@ class PlateElement(Element):
 
         self.polygon: Polygon = polygon
         self.thickness: float = thickness
-        normal: Vector = polygon.normal
-        down: Vector = normal * (0.0 * thickness)
-        up: Vector = normal * (-1.0 * thickness)
-        self.bottom: Polygon = polygon.copy()
-        for point in self.bottom.points:
-            point += down
-        self.top: Polygon = polygon.copy()
-        for point in self.top.points:
-            point += up
+        self._bottom: Optional[Polygon] = None
+        self._top: Optional[Polygon] = None
+        self._modelpoints: Optional[tuple[Mesh, np.ndarray]] = None
+        self._face_polygons: Optional[tuple[Mesh, list[Polygon]]] = None
+        self._face_polygons_packed: Optional[tuple[Mesh, np.ndarray]] = None
+
+    @property
+    def bottom(self) -> Polygon:
+        if self._bottom is None:
+            self._bottom, self._top = self.compute_bottom_and_top_polygons()
+        return self._bottom
+
+    @property
+    def top(self) -> Polygon:
+        if self._top is None:
+            self._bottom, self._top = self.compute_bottom_and_top_polygons()
+        return self._top
+
+    @property
+    def face_polygons(self) -> list[Polygon]:
+        modelgeometry: Mesh = self.modelgeometry
+        if self._face_polygons is None or self._face_polygons[0] is not modelgeometry:
+            self._face_polygons = (modelgeometry, face_polygons_numpy(modelgeometry))
+        return self._face_polygons[1]
+
+    @property
+    def face_polygons_packed(self) -> np.ndarray:
+        """The face polygons of the model geometry as a single float32 array of shape (F, maxV, 3).
+        Faces with fewer than maxV vertices are padded with NaN.
+        The array is read-only and cached until the model geometry is recomputed.
+        Viewers and collision pipelines should consume this array directly instead of :attr:`face_polygons`.
+        """
+        modelgeometry: Mesh = self.modelgeometry
+        if self._face_polygons_packed is None or self._face_polygons_packed[0] is not modelgeometry:
+            packed: np.ndarray = faces_packed_numpy(*modelgeometry.to_vertices_and_faces())
+            packed.flags.writeable = False
+            self._face_polygons_packed = (modelgeometry, packed)
+        return self._face_polygons_packed[1]
+
+    def compute_bottom_and_top_polygons(self) -> tuple[Polygon, Polygon]:
+        """Compute the bottom and top polygons of the plate by offsetting the polygon along its normal.
+
+        Returns
+        -------
+        tuple[:class:`compas.geometry.Polygon`, :class:`compas.geometry.Polygon`]
+
+        """
+        bottom, top = _offset_polygon(tuple(map(tuple, self.polygon.points)), self.thickness)
+        return Polygon(bottom), Polygon(top)
 
     def compute_elementgeometry(self) -> Mesh:
         """Compute the shape of the plate from the given polygons.
@@ -89,14 +213,59 @@ class PlateElement(Element):
         """
         offset: int = len(self.bottom)
         vertices: list[Point] = self.bottom.points + self.top.points  # type: ignore
-        bottom: list[int] = list(range(offset))
-        top: list[int] = [i + offset for i in bottom]
-        faces: list[list[int]] = [bottom[::-1], top]
-        for (a, b), (c, d) in zip(pairwise(bottom + bottom[:1]), pairwise(top + top[:1])):
-            faces.append([a, b, d, c])
+        faces: list[list[int]] = prism_faces(offset)
         mesh: Mesh = Mesh.from_vertices_and_faces(vertices, faces)
         return mesh
 
+    def compute_modelpoints(self) -> np.ndarray:
+        """Compute the vertex coordinates of the model geometry.
+        The coordinates are cached until the model geometry is recomputed.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The XYZ coordinates of the vertices, as an array of shape (V, 3).
+
+        """
+        self._modelpoints = cached_mesh_points_numpy(self._modelpoints, self.modelgeometry)  # type: ignore
+        return self._modelpoints[1]
+
+    # =============================================================================
+    # Constructors
+    # =============================================================================
+
+    @classmethod
+    def from_polygons_and_thickness(cls, polygons: list[Polygon], thickness: float = 0.1) -> list["PlateElement"]:
+        """Construct plate elements from a list of polygons with the same thickness.
+        The bottom and top polygons of all plates with the same number of points are computed in a single vectorized pass.
+
+        Parameters
+        ----------
+        polygons : list[:class:`compas.geometry.Polygon`]
+            The base polygons of the plates.
+        thickness : float, optional
+            The thickness of the plates.
+
+        Returns
+        -------
+        list[:class:`PlateElement`]
+
+        """
+        plates: list[PlateElement] = [cls(polygon, thickness) for polygon in polygons]
+
+        groups: dict[int, list[PlateElement]] = {}
+        for plate in plates:
+            groups.setdefault(len(plate.polygon.points), []).append(plate)
+
+        for group in groups.values():
+            points: np.ndarray = np.asarray([plate.polygon.points for plate in group], dtype=float)
+            bottoms, tops = _offset_polygons(points, thickness)
+            for plate, bottom, top in zip(group, bottoms.tolist(), tops.tolist()):
+                plate._bottom = Polygon(bottom)
+                plate._top = Polygon(top)
+
+        return plates
+
     # =============================================================================
     # Implementations of abstract methods
     # =============================================================================
@@ -114,16 +283,14 @@ class PlateElement(Element):
         :class:`compas.geometry.Box`
             The axis-aligned bounding box.
         """
-        box = self.modelgeometry.aabb
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = aabb_from_points_numpy(self.compute_modelpoints(), inflate)
         self._aabb = box
         return box
 
     def compute_obb(self, inflate: Optional[bool] = None) -> Box:
         """Compute the oriented bounding box of the element.
+        The box of a rectangular plate is constructed directly from its polygon and thickness,
+        other plates fall back to the oriented bounding box of the model geometry.
 
         Parameters
         ----------
@@ -135,11 +302,12 @@ class PlateElement(Element):
         :class:`compas.geometry.Box`
             The oriented bounding box.
         """
-        box = self.modelgeometry.obb
-        if inflate and inflate != 1.0:
-            box.xsize += inflate
-            box.ysize += inflate
-            box.zsize += inflate
+        box = _rectangle_box(np.asarray(self.polygon.points, dtype=float), self.thickness)
+        if box is None:
+            box = obb_from_points_numpy(self.compute_modelpoints())
+        else:
+            box.transform(self.modeltransformation)
+        box = inflate_box(box, inflate)
         self._obb = box
         return box
 
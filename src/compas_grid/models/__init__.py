@@ -2,5 +2,5 @@ from .gridmodel import GridModel
 
 
 __all__ = [
-    GridModel,
+    "GridModel",
 ]
@@ -1,3 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Optional
+
+import numpy as np
 from compas_model.elements import Element  # noqa: F401
 from compas_model.interactions import Modifier  # noqa: F401
 from compas_model.models import ElementNode  # noqa: F401
@@ -6,6 +11,7 @@ from compas_model.models import Model  # noqa: F401
 from compas.datastructures import CellNetwork as BaseCellNetwork
 from compas.datastructures import Graph
 from compas.datastructures import Mesh
+from compas.geometry import Box
 from compas.geometry import Frame
 from compas.geometry import Line
 from compas.geometry import Point
@@ -14,10 +20,20 @@ from compas.geometry import Vector
 from compas.geometry.transformation import Transformation
 from compas.geometry.translation import Translation
 from compas.tolerance import TOL
+from compas_grid._geometry import box_from_bounds
 from compas_grid.elements import BeamElement  # noqa: F401
 from compas_grid.elements import ColumnElement  # noqa: F401
 from compas_grid.elements import ColumnHeadElement  # noqa: F401
 from compas_grid.elements import PlateElement  # noqa: F401
+from compas_grid.spatial import AABBIndex
+
+
+def _map_elements(function: Callable, elements: list[Element], max_workers: int = 1) -> list:
+    # Map a function over elements, in a thread pool if more than one worker is requested.
+    if max_workers > 1 and len(elements) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(function, elements))
+    return [function(element) for element in elements]
 
 
 class CellNetwork(BaseCellNetwork):
@@ -79,28 +95,31 @@ class CellNetwork(BaseCellNetwork):
         #######################################################################################################
         cell_network: CellNetwork = cls()
         cell_network_vertex_keys: dict[str, int] = {}  # Store vertex geometric keys to map faces to vertices
+        node_xyz: dict[int, list[float]] = {node: graph.node_attributes(node, "xyz") for node in graph.nodes()}  # Query the coordinates once
 
         # Add vertices to CellNetwork and store geometric keys
-        for node in graph.nodes():
-            xyz: list[float] = graph.node_attributes(node, "xyz")
+        for node, xyz in node_xyz.items():
             cell_network.add_vertex(x=xyz[0], y=xyz[1], z=xyz[2])
             cell_network_vertex_keys[TOL.geometric_key(xyz, precision=tolerance)] = node
 
-        # Add edges to CellNetwork and store geometric keys
-        for edge in graph.edges():
-            cell_network.add_edge(*edge)
+        # Add edges to CellNetwork with their attributes: is_column or is_beam, from the height difference of their vertices
+        for u, v in graph.edges():
+            if not abs(node_xyz[u][2] - node_xyz[v][2]) < 1 / max(1, tolerance):
+                cell_network.add_edge(u, v, attr_dict={"is_column": True})
+            else:
+                cell_network.add_edge(u, v, attr_dict={"is_beam": True})
 
         #######################################################################################################
         # Add vertex neighbors from the Graph to the CellNetwork.
         #######################################################################################################
 
         for vertex in cell_network.vertices():
-            z0: float = graph.node_attributes(vertex, "xyz")[2]
+            z0: float = node_xyz[vertex][2]
             # Get horizontal neighbors
             neighbor_beams: list[int] = []
 
             for neighbor in graph.neighbors(vertex):
-                if abs(z0 - graph.node_attributes(neighbor, "xyz")[2]) < 1 / max(1, tolerance):
+                if abs(z0 - node_xyz[neighbor][2]) < 1 / max(1, tolerance):
                     neighbor_beams.append(neighbor)
             cell_network.vertex_attribute(vertex, "neighbors", neighbor_beams)
 
@@ -108,15 +127,6 @@ class CellNetwork(BaseCellNetwork):
         # Add geometric attributes: is_column, is_beam, is_floor, is_facade, is_core and so on.
         #######################################################################################################
 
-        # Edges - Beams and Columns
-        for u, v in graph.edges():
-            xyz_u: list[float] = graph.node_attributes(u, "xyz")
-            xyz_v: list[float] = graph.node_attributes(v, "xyz")
-            if not abs(xyz_u[2] - xyz_v[2]) < 1 / max(1, tolerance):
-                cell_network.edge_attribute((u, v), "is_column", True)
-            else:
-                cell_network.edge_attribute((u, v), "is_beam", True)
-
         # Faces - Floors
         for mesh in floor_surfaces:
             gkeys: dict[int, str] = mesh.vertex_gkey(precision=tolerance)
@@ -195,29 +205,37 @@ class GridModel(Model):
 
         self._reset__elements_by_type = False
 
+    def add_element(self, element: Element, parent: Element = None, material=None) -> Element:
+        self._reset__elements_by_type = True
+        return super(GridModel, self).add_element(element, parent=parent, material=material)
+
+    def remove_element(self, element: Element) -> None:
+        self._reset__elements_by_type = True
+        super(GridModel, self).remove_element(element)
+
     @property
     def columnheads(self):
-        if self.reset_partitions:
+        if self._reset__elements_by_type:
             self._partition__elements_by_type()
-        return self._elements_by_type[ColumnHeadElement]
+        return self._elements_by_type.get(ColumnHeadElement, [])
 
     @property
     def columns(self):
-        if self.reset_partitions:
+        if self._reset__elements_by_type:
             self._partition__elements_by_type()
-        return self._elements_by_type[ColumnElement]
+        return self._elements_by_type.get(ColumnElement, [])
 
     @property
     def beams(self):
-        if self.reset_partitions:
+        if self._reset__elements_by_type:
             self._partition__elements_by_type()
-        return self._elements_by_type[BeamElement]
+        return self._elements_by_type.get(BeamElement, [])
 
     @property
     def floors(self):
-        if self.reset_partitions:
+        if self._reset__elements_by_type:
             self._partition__elements_by_type()
-        return self._elements_by_type[PlateElement]
+        return self._elements_by_type.get(PlateElement, [])
 
     @property
     def geometry(self):
@@ -226,6 +244,114 @@ class GridModel(Model):
             model_geometry.append(element.modelgeometry)
         return model_geometry
 
+    def _compute_aabb_bounds(self, elements: list[Element], max_workers: int = 1, recompute: bool = True) -> np.ndarray:
+        # The bounds of beams and columns are computed in a single batch by transforming the corners of their local boxes at once,
+        # all other elements compute their own box, without inflation.
+        # Without recomputing, the other elements use their cached box, so that their state is not changed.
+        bounds: np.ndarray = np.zeros((len(elements), 6))
+
+        batch: list[int] = [i for i, element in enumerate(elements) if type(element).compute_aabb in (BeamElement.compute_aabb, ColumnElement.compute_aabb)]
+        if batch:
+            corners: np.ndarray = np.asarray([elements[i].box.points for i in batch], dtype=float)
+            matrices: np.ndarray = np.asarray([elements[i].modeltransformation.matrix for i in batch], dtype=float)
+            points: np.ndarray = np.einsum("nij,nkj->nki", matrices[:, :3, :3], corners) + matrices[:, np.newaxis, :3, 3]
+            bounds[batch] = np.hstack((points.min(axis=1), points.max(axis=1)))
+
+        batched: set[int] = set(batch)
+        others: list[int] = [i for i in range(len(elements)) if i not in batched]
+        function: Callable = (lambda element: element.compute_aabb()) if recompute else (lambda element: element.aabb)
+        for i, box in zip(others, _map_elements(function, [elements[i] for i in others], max_workers)):
+            points: np.ndarray = np.asarray(box.points, dtype=float)
+            bounds[i] = np.hstack((points.min(axis=0), points.max(axis=0)))
+
+        return bounds
+
+    def compute_aabbs(self, inflate: Optional[float] = None, max_workers: int = 1) -> list[Box]:
+        """Compute the axis-aligned bounding boxes of all elements of the model.
+        The boxes of beams and columns are computed in a single batch by transforming the corners of their local boxes at once,
+        all other elements compute their own box.
+        The boxes without inflation are stored as the axis-aligned bounding boxes of the elements,
+        the inflated boxes are only returned.
+
+        Parameters
+        ----------
+        inflate : float, optional
+            The inflation of the bounding boxes.
+        max_workers : int, optional
+            The number of threads computing the boxes of the elements outside the batch.
+            With more than one worker, the geometry of the elements is computed concurrently.
+
+        Returns
+        -------
+        list[:class:`compas.geometry.Box`]
+            The axis-aligned bounding boxes, in the order of :meth:`elements`.
+
+        """
+        elements: list[Element] = list(self.elements())
+        bounds: np.ndarray = self._compute_aabb_bounds(elements, max_workers)
+
+        boxes: list[Box] = []
+        for element, (xmin, ymin, zmin, xmax, ymax, zmax) in zip(elements, bounds.tolist()):
+            box: Box = box_from_bounds([xmin, ymin, zmin], [xmax, ymax, zmax])
+            element._aabb = box
+            if inflate and inflate != 1.0:
+                box = box_from_bounds([xmin, ymin, zmin], [xmax, ymax, zmax], inflate)
+            boxes.append(box)
+
+        return boxes
+
+    def compute_collision_meshes(self, max_workers: int = 1) -> list[Mesh]:
+        """Compute the collision meshes of all elements of the model.
+        The meshes are stored as the collision meshes of the elements,
+        so that later collision queries do not compute the convex hulls again.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The number of threads computing the collision meshes.
+            Qhull releases the GIL, so the convex hulls of several elements can be computed at the same time.
+
+        Returns
+        -------
+        list[:class:`compas.datastructures.Mesh`]
+            The collision meshes, in the order of :meth:`elements`.
+
+        """
+        elements: list[Element] = list(self.elements())
+        meshes: list[Mesh] = _map_elements(lambda element: element.compute_collision_mesh(), elements, max_workers)
+        for element, mesh in zip(elements, meshes):
+            element._collision_mesh = mesh
+        return meshes
+
+    def compute_aabbindex(self, inflate: Optional[float] = None, node_size: int = 16) -> AABBIndex:
+        """Compute a spatial index of the axis-aligned bounding boxes of all elements of the model.
+        The index is used as broad phase to find the elements near an element,
+        before testing their geometry or interactions.
+        The index is static, and has to be recomputed when elements are added, removed or transformed.
+        Building the index does not change the bounding boxes stored on the elements.
+
+        Parameters
+        ----------
+        inflate : float, optional
+            The inflation of the bounding boxes.
+        node_size : int, optional
+            The number of children per node of the index.
+
+        Returns
+        -------
+        :class:`compas_grid.spatial.AABBIndex`
+            The index, with the elements in the order of :meth:`elements`.
+
+        """
+        elements: list[Element] = list(self.elements())
+        bounds: np.ndarray = self._compute_aabb_bounds(elements, recompute=False)
+        if inflate and inflate != 1.0:
+            bounds[:, :3] -= 0.5 * inflate
+            bounds[:, 3:] += 0.5 * inflate
+        index: AABBIndex = AABBIndex(bounds, node_size=node_size)
+        index.elements = elements
+        return index
+
     @classmethod
     def from_lines_and_surfaces(
         cls,
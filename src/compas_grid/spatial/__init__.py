@@ -0,0 +1,6 @@
+from .aabbindex import AABBIndex
+
+
+__all__ = [
+    "AABBIndex",
+]
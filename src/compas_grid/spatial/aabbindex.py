@@ -0,0 +1,222 @@
+from typing import Optional
+
+import numpy as np
+from compas_model.elements import Element
+from numpy.typing import ArrayLike
+
+from compas.geometry import Box
+
+
+def _hilbert_xy(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Compute the index on a 16-bit Hilbert curve of integer XY-coordinates in the range [0, 65535].
+    This is the branch free bit interleaving of Flatbush, evaluated for all coordinates at once.
+
+    Parameters
+    ----------
+    x : :class:`numpy.ndarray`
+        The X-coordinates, as an array of unsigned integers.
+    y : :class:`numpy.ndarray`
+        The Y-coordinates, as an array of unsigned integers.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The Hilbert indices, as an array of unsigned 32-bit integers.
+
+    """
+    x: np.ndarray = x.astype(np.uint32)
+    y: np.ndarray = y.astype(np.uint32)
+    mask = np.uint32(0xFFFF)
+
+    a = x ^ y
+    b = mask ^ a
+    c = mask ^ (x | y)
+    d = x & (y ^ mask)
+
+    A = a | (b >> 1)
+    B = (a >> 1) ^ a
+    C = ((c >> 1) ^ (b & (d >> 1))) ^ c
+    D = ((a & (c >> 1)) ^ (d >> 1)) ^ d
+
+    for shift in (2, 4):
+        a, b, c, d = A, B, C, D
+        A = (a & (a >> shift)) ^ (b & (b >> shift))
+        B = (a & (b >> shift)) ^ (b & ((a ^ b) >> shift))
+        C = C ^ ((a & (c >> shift)) ^ (b & (d >> shift)))
+        D = D ^ ((b & (c >> shift)) ^ ((a ^ b) & (d >> shift)))
+
+    a, b, c, d = A, B, C, D
+    C = C ^ ((a & (c >> 8)) ^ (b & (d >> 8)))
+    D = D ^ ((b & (c >> 8)) ^ ((a ^ b) & (d >> 8)))
+
+    a = C ^ (C >> 1)
+    b = D ^ (D >> 1)
+
+    i0 = x ^ y
+    i1 = b | (mask ^ (i0 | a))
+
+    for shift, bits in ((8, 0x00FF00FF), (4, 0x0F0F0F0F), (2, 0x33333333), (1, 0x55555555)):
+        i0 = (i0 | (i0 << shift)) & np.uint32(bits)
+        i1 = (i1 | (i1 << shift)) & np.uint32(bits)
+
+    return (i1 << 1) | i0
+
+
+class AABBIndex:
+    """Static spatial index of axis-aligned bounding boxes, packed in a Hilbert-ordered R-tree.
+
+    The boxes are sorted along a Hilbert curve through the XY-coordinates of their centers,
+    and grouped bottom-up into nodes of a fixed size, as in the Flatbush library.
+    All boxes of a level are stored in a single contiguous array,
+    so that a query tests all candidate nodes of a level in one vectorized comparison.
+    The index is static: it has to be rebuilt when the boxes change, for example after transforming elements.
+
+    Parameters
+    ----------
+    boxes : array-like
+        The bounds of the boxes, as an array of shape (N, 6) with rows ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+    node_size : int, optional
+        The number of children per node of the tree.
+
+    Attributes
+    ----------
+    boxes : :class:`numpy.ndarray`
+        The bounds of the boxes in their input order, as an array of shape (N, 6).
+    node_size : int
+        The number of children per node of the tree.
+    elements : list[:class:`compas_model.elements.Element`]
+        The elements of the boxes, if the index was constructed from elements.
+
+    """
+
+    def __init__(self, boxes: ArrayLike, node_size: int = 16) -> None:
+        self.boxes: np.ndarray = np.asarray(boxes, dtype=float).reshape(-1, 6)
+        self.node_size: int = max(2, node_size)
+        self.elements: list[Element] = []
+        self._order: np.ndarray = np.zeros(0, dtype=int)
+        self._levels: list[np.ndarray] = []
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    def _build(self) -> None:
+        if len(self.boxes) == 0:
+            return
+
+        # Sort the boxes along the Hilbert curve through their centers, scaled to the 16-bit grid of the curve.
+        centers: np.ndarray = 0.5 * (self.boxes[:, :2] + self.boxes[:, 3:5])
+        lower: np.ndarray = centers.min(axis=0)
+        size: np.ndarray = centers.max(axis=0) - lower
+        size[size == 0] = 1.0
+        grid: np.ndarray = np.floor(65535 * (centers - lower) / size)
+        self._order = np.argsort(_hilbert_xy(grid[:, 0], grid[:, 1]), kind="stable")
+
+        level: np.ndarray = self.boxes[self._order]
+        self._levels = [level]
+        while len(level) > 1:
+            starts: np.ndarray = np.arange(0, len(level), self.node_size)
+            level = np.hstack((np.minimum.reduceat(level[:, :3], starts, axis=0), np.maximum.reduceat(level[:, 3:], starts, axis=0)))
+            self._levels.append(level)
+
+    # =============================================================================
+    # Constructors
+    # =============================================================================
+
+    @classmethod
+    def from_elements(cls, elements: list[Element], inflate: Optional[float] = None, node_size: int = 16) -> "AABBIndex":
+        """Construct an index of the axis-aligned bounding boxes of model elements.
+        The cached boxes of the elements are used, the inflation is only applied to the bounds of the index.
+
+        Parameters
+        ----------
+        elements : list[:class:`compas_model.elements.Element`]
+            The elements.
+        inflate : float, optional
+            The inflation of the bounding boxes.
+        node_size : int, optional
+            The number of children per node of the tree.
+
+        Returns
+        -------
+        :class:`AABBIndex`
+
+        """
+        elements: list[Element] = list(elements)
+        points: np.ndarray = np.asarray([element.aabb.points for element in elements], dtype=float).reshape(-1, 8, 3)
+        boxes: np.ndarray = np.hstack((points.min(axis=1), points.max(axis=1)))
+        if inflate and inflate != 1.0:
+            boxes[:, :3] -= 0.5 * inflate
+            boxes[:, 3:] += 0.5 * inflate
+        index: AABBIndex = cls(boxes, node_size=node_size)
+        index.elements = elements
+        return index
+
+    # =============================================================================
+    # Queries
+    # =============================================================================
+
+    def query(self, bounds: ArrayLike) -> np.ndarray:
+        """Find the boxes intersecting a box.
+
+        Parameters
+        ----------
+        bounds : array-like
+            The bounds of the query box ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The sorted indices of the intersecting boxes, in the input order of the boxes.
+
+        """
+        if not self._levels:
+            return np.zeros(0, dtype=int)
+
+        bounds: np.ndarray = np.asarray(bounds, dtype=float)
+        lower: np.ndarray = bounds[:3]
+        upper: np.ndarray = bounds[3:]
+
+        nodes: np.ndarray = np.arange(len(self._levels[-1]))
+        for depth in range(len(self._levels) - 1, -1, -1):
+            level: np.ndarray = self._levels[depth][nodes]
+            nodes = nodes[np.all(level[:, :3] <= upper, axis=1) & np.all(level[:, 3:] >= lower, axis=1)]
+            if depth == 0 or len(nodes) == 0:
+                break
+            children: np.ndarray = (nodes[:, np.newaxis] * self.node_size + np.arange(self.node_size)).ravel()
+            nodes = children[children < len(self._levels[depth - 1])]
+
+        return np.sort(self._order[nodes])
+
+    def query_box(self, box: Box) -> np.ndarray:
+        """Find the boxes intersecting the axis-aligned bounding box of a box.
+
+        Parameters
+        ----------
+        box : :class:`compas.geometry.Box`
+            The query box.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The sorted indices of the intersecting boxes, in the input order of the boxes.
+
+        """
+        points: np.ndarray = np.asarray(box.points, dtype=float)
+        return self.query(points.min(axis=0).tolist() + points.max(axis=0).tolist())
+
+    def query_pairs(self) -> list[tuple[int, int]]:
+        """Find all pairs of intersecting boxes in the index.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The index pairs ``(i, j)`` with ``i < j`` of the intersecting boxes.
+
+        """
+        pairs: list[tuple[int, int]] = []
+        for i, bounds in enumerate(self.boxes):
+            for j in self.query(bounds).tolist():
+                if j > i:
+                    pairs.append((i, j))
+        return pairs
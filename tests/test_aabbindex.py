@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Translation
+from compas_grid.elements import BeamElement
+from compas_grid.elements import ColumnElement
+from compas_grid.models import GridModel
+from compas_grid.spatial import AABBIndex
+
+
+def _random_boxes(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    lower = rng.uniform(0.0, 100.0, (n, 3))
+    return np.hstack((lower, lower + rng.uniform(0.1, 10.0, (n, 3))))
+
+
+def _brute_force(boxes: np.ndarray, query) -> list[int]:
+    query = np.asarray(query, dtype=float)
+    mask = np.all(boxes[:, :3] <= query[3:], axis=1) & np.all(boxes[:, 3:] >= query[:3], axis=1)
+    return np.flatnonzero(mask).tolist()
+
+
+@pytest.mark.parametrize("n", [1, 2, 17, 500])
+@pytest.mark.parametrize("node_size", [2, 4, 16])
+def test_query_matches_brute_force(n, node_size):
+    boxes = _random_boxes(n)
+    index = AABBIndex(boxes, node_size=node_size)
+    assert len(index) == n
+    for query in _random_boxes(50, seed=1).tolist() + boxes.tolist():
+        assert index.query(query).tolist() == _brute_force(boxes, query)
+
+
+@pytest.mark.parametrize("node_size", [2, 16])
+def test_query_pairs_matches_brute_force(node_size):
+    boxes = _random_boxes(300)
+    index = AABBIndex(boxes, node_size=node_size)
+    expected = [(i, j) for i in range(len(boxes)) for j in _brute_force(boxes, boxes[i]) if j > i]
+    assert sorted(index.query_pairs()) == expected
+
+
+def test_query_box_matches_brute_force():
+    boxes = _random_boxes(200)
+    index = AABBIndex(boxes)
+    box = Box(20.0, 30.0, 40.0, frame=Frame([50.0, 50.0, 50.0], [1, 0, 0], [0, 1, 0]))
+    assert index.query_box(box).tolist() == _brute_force(boxes, [40.0, 35.0, 30.0, 60.0, 65.0, 70.0])
+
+
+def test_empty_index():
+    index = AABBIndex([])
+    assert len(index) == 0
+    assert index.query([0, 0, 0, 1, 1, 1]).tolist() == []
+    assert index.query_pairs() == []
+
+
+def test_single_box():
+    index = AABBIndex([[0, 0, 0, 1, 1, 1]])
+    assert index.query([0.5, 0.5, 0.5, 2, 2, 2]).tolist() == [0]
+    assert index.query([1, 1, 1, 2, 2, 2]).tolist() == [0]
+    assert index.query([1.5, 1.5, 1.5, 2, 2, 2]).tolist() == []
+    assert index.query_pairs() == []
+
+
+@pytest.mark.parametrize("node_size", [2, 3, 16])
+def test_coincident_centers(node_size):
+    sizes = np.linspace(0.5, 5.0, 40)[:, np.newaxis]
+    boxes = np.hstack((-sizes.repeat(3, axis=1), sizes.repeat(3, axis=1)))
+    index = AABBIndex(boxes, node_size=node_size)
+    assert index.query([4.0, 4.0, 4.0, 6.0, 6.0, 6.0]).tolist() == _brute_force(boxes, [4.0, 4.0, 4.0, 6.0, 6.0, 6.0])
+    assert len(index.query_pairs()) == len(boxes) * (len(boxes) - 1) // 2
+
+
+@pytest.mark.parametrize("inflate", [None, 1.5])
+def test_from_elements(inflate):
+    elements = [BeamElement(transformation=Translation.from_vector([i, 0, 0])) for i in range(5)]
+    elements += [ColumnElement(transformation=Translation.from_vector([0, 2 * i, 0])) for i in range(5)]
+    model = GridModel()
+    for element in elements:
+        model.add_element(element)
+    sizes = [(element.aabb.xsize, element.aabb.ysize, element.aabb.zsize) for element in elements]
+
+    index = AABBIndex.from_elements(elements, inflate=inflate)
+
+    assert index.elements == elements
+    offset = 0.5 * inflate if inflate else 0.0
+    for element, bounds, size in zip(elements, index.boxes, sizes):
+        points = np.asarray(element.aabb.points, dtype=float)
+        assert bounds.tolist() == pytest.approx((points.min(axis=0) - offset).tolist() + (points.max(axis=0) + offset).tolist())
+        assert (element.aabb.xsize, element.aabb.ysize, element.aabb.zsize) == pytest.approx(size)
+    for i, bounds in enumerate(index.boxes):
+        assert index.query(bounds).tolist() == _brute_force(index.boxes, bounds)
@@ -0,0 +1,173 @@
+import warnings
+
+import numpy as np
+import pytest
+
+import compas_grid.elements.beam
+from compas.geometry import Frame
+from compas.geometry import Plane
+from compas.geometry import Point
+from compas.geometry import Transformation
+from compas.geometry import Translation
+from compas.geometry import intersection_line_plane
+from compas.geometry import is_point_in_polygon_xy
+from compas_grid._geometry import is_point_in_polygons_xy_numpy
+from compas_grid.elements import BeamElement
+from compas_grid.elements import BeamProfileElement
+from compas_grid.models import GridModel
+
+
+@pytest.fixture
+def slicer_plane(monkeypatch):
+    # Return the slicing plane itself instead of wrapping it in a modifier.
+    monkeypatch.setattr(compas_grid.elements.beam, "SlicerModifier", lambda plane: plane)
+
+
+def _random_frame(rng: np.random.Generator, point=None) -> Frame:
+    xaxis, yaxis = rng.normal(size=(2, 3)).tolist()
+    return Frame(rng.uniform(-5.0, 5.0, 3).tolist() if point is None else point, xaxis, yaxis)
+
+
+def _reference_slicer_plane(beam: BeamElement, target: BeamElement) -> Plane:
+    # The face loop of the original implementation, with the distances measured in world coordinates.
+    mesh = beam.elementgeometry.transformed(beam.modeltransformation)
+    center_line = target.center_line.transformed(target.modeltransformation)
+    closest_distance = float("inf")
+    closest_face = 0
+    for face in mesh.faces():
+        polygon = mesh.face_polygon(face)
+        frame = polygon.frame
+        result = intersection_line_plane(center_line, Plane.from_frame(frame))
+        if result:
+            point = Point(*result)
+            xform = Transformation.from_frame_to_frame(frame, Frame.worldXY())
+            if is_point_in_polygon_xy(point.transformed(xform), polygon.transformed(xform)):
+                d = max(center_line.start.distance_to_point(point), center_line.end.distance_to_point(point))
+                if d < closest_distance:
+                    closest_distance = d
+                    closest_face = face
+    frame = mesh.face_polygon(closest_face).frame
+    return Plane(frame.point, -frame.normal)
+
+
+def _crossing_pairs(beam: BeamElement, seed: int, count: int = 20):
+    # Targets whose center lines pass through random points of the convex hull of the beam, in random directions.
+    rng = np.random.default_rng(seed)
+    model = GridModel()
+    model.add_element(beam)
+    vertices = np.asarray(beam.modelgeometry.vertices_attributes("xyz"), dtype=float)
+    for _ in range(count):
+        point = rng.dirichlet(np.ones(len(vertices))) @ vertices
+        target = BeamElement(0.1, 0.1, 4.0)
+        frame = _random_frame(rng)
+        frame.point = (point - 2.0 * np.asarray(frame.zaxis)).tolist()
+        target.transformation = Transformation.from_frame(frame)
+        model.add_element(target)
+        yield target
+
+
+def _beams():
+    rng = np.random.default_rng(0)
+    box = BeamElement(0.3, 0.5, 3.0, transformation=Transformation.from_frame(_random_frame(rng)))
+    profile = BeamProfileElement.from_t_profile(0.3, 0.5, 0.1, 0.1, 3.0, transformation=Transformation.from_frame(_random_frame(rng)))
+    return [box, profile]
+
+
+@pytest.mark.parametrize("index", [0, 1])
+def test_create_slicer_modifier_matches_reference(slicer_plane, index):
+    beam = _beams()[index]
+    for target in _crossing_pairs(beam, seed=index):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            plane = beam._create_slicer_modifier(target)
+        expected = _reference_slicer_plane(beam, target)
+        assert list(plane.point) == pytest.approx(list(expected.point), abs=1e-9)
+        assert list(plane.normal) == pytest.approx(list(expected.normal), abs=1e-9)
+
+
+def _axis_aligned_pair(start: float, end: float):
+    # A vertical beam and a horizontal target through the centers of two opposite faces, parallel to the other faces.
+    model = GridModel()
+    beam = model.add_element(BeamElement(0.1, 0.2, 3.0, transformation=Translation.from_vector([10.0, 20.0, 0.0])))
+    frame = Frame([start, 20.0, 1.5], [0, 1, 0], [0, 0, 1])
+    target = model.add_element(BeamElement(0.1, 0.1, end - start, transformation=Transformation.from_frame(frame)))
+    return beam, target
+
+
+def test_create_slicer_modifier_parallel_faces(slicer_plane):
+    beam, target = _axis_aligned_pair(9.5, 12.0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        plane = beam._create_slicer_modifier(target)
+    expected = _reference_slicer_plane(beam, target)
+    assert list(plane.point) == pytest.approx(list(expected.point))
+    assert list(plane.normal) == pytest.approx(list(expected.normal))
+
+
+def _random_polygon(rng: np.random.Generator, size: int) -> np.ndarray:
+    # A star shaped polygon, which is not convex for most random radii.
+    angles = np.sort(rng.uniform(0.0, 2 * np.pi, size))
+    radii = rng.uniform(0.2, 1.0, size)
+    return np.column_stack((radii * np.cos(angles), radii * np.sin(angles), np.zeros(size)))
+
+
+def test_is_point_in_polygons_xy_numpy_matches_compas():
+    rng = np.random.default_rng(1)
+    size = 9
+    points, polygons, expected = [], [], []
+    for _ in range(300):
+        polygon = _random_polygon(rng, int(rng.integers(3, size + 1)))
+        point = rng.uniform(-1.0, 1.0, 3) * [1, 1, 0]
+        expected.append(is_point_in_polygon_xy(point.tolist(), polygon.tolist()))
+        points.append(point)
+        # Pad the polygon to the common size by repeating its first corner.
+        polygons.append(np.vstack((polygon, polygon[:1].repeat(size - len(polygon), axis=0))))
+
+    result = is_point_in_polygons_xy_numpy(points, polygons)
+
+    assert result.tolist() == expected
+    assert any(expected) and not all(expected)
+
+
+def test_is_point_in_polygons_xy_numpy_non_convex():
+    # An L-shaped polygon with a point in its notch, and a square padded to six corners.
+    polygon = [[0, 0, 0], [2, 0, 0], [2, 1, 0], [1, 1, 0], [1, 2, 0], [0, 2, 0]]
+    square = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]] + [[0, 0, 0]] * 2
+    points = [[1.5, 1.5, 0], [0.5, 1.5, 0], [1.5, 0.5, 0], [0.5, 0.5, 0]]
+    result = is_point_in_polygons_xy_numpy(points, [polygon, polygon, polygon, square])
+    assert result.tolist() == [is_point_in_polygon_xy(point, polygon) for point in points[:3]] + [True]
+    assert result.tolist() == [False, True, True, True]
+
+
+def test_create_slicer_modifier_closest_face_in_world_coordinates(slicer_plane):
+    # The target runs from x=8.0 to x=10.5, so the face at x=9.95 is closest to its ends.
+    # Measured in the local frames of the faces, both faces are equally close and the first face at x=10.05 was chosen.
+    beam, target = _axis_aligned_pair(8.0, 10.5)
+    plane = beam._create_slicer_modifier(target)
+    assert list(plane.point) == pytest.approx([9.95, 20.0, 1.5])
+    assert list(plane.normal) == pytest.approx([1.0, 0.0, 0.0])
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda beam: setattr(beam, "width", 0.3),
+        lambda beam: setattr(beam, "height", 0.4),
+        lambda beam: setattr(beam, "length", 5.0),
+        lambda beam: beam.extend(0.5),
+        lambda beam: setattr(beam, "transformation", Translation.from_vector([1.0, 2.0, 3.0])),
+    ],
+)
+def test_compute_slicer_faces_reset(change):
+    model = GridModel()
+    beam = model.add_element(BeamElement(0.1, 0.2, 3.0))
+    before = beam._compute_slicer_faces()
+    assert beam._compute_slicer_faces() is before
+
+    change(beam)
+    after = beam._compute_slicer_faces()
+
+    mesh = beam.elementgeometry.transformed(beam.modeltransformation)
+    assert after is not before
+    assert np.allclose(after[0], [mesh.face_centroid(face) for face in mesh.faces()])
+    assert not np.allclose(after[0], before[0])
@@ -0,0 +1,42 @@
+import pytest
+
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas_grid.elements.block import BlockMesh
+
+pytest.importorskip("compas_cgal")
+
+
+def _box(point, xsize: float, ysize: float, zsize: float) -> BlockMesh:
+    return BlockMesh.from_shape(Box(xsize, ysize, zsize, frame=Frame(point, [1, 0, 0], [0, 1, 0])), triangulated=True)
+
+
+def _bounds(mesh: BlockMesh) -> list[float]:
+    xyz = mesh.vertices_attributes("xyz")
+    return [min(p[i] for p in xyz) for i in range(3)] + [max(p[i] for p in xyz) for i in range(3)]
+
+
+CUTTERS = {
+    "overlapping": [([0.9, 0.3, 0.1], 1.0, 1.0, 3.0), ([0.7, 0.6, 0.1], 1.0, 1.0, 3.0)],
+    "disjoint": [([0.9, 0.3, 0.1], 1.0, 1.0, 3.0), ([-0.9, -0.4, 0.2], 0.8, 0.6, 3.0)],
+}
+
+
+@pytest.mark.parametrize("cutters", CUTTERS.values(), ids=CUTTERS.keys())
+def test_boolean_difference_matches_sequential(cutters):
+    block = _box([0.0, 0.0, 0.0], 2.0, 2.0, 2.0)
+    a, b = [_box(*cutter) for cutter in cutters]
+    expected = block.boolean_difference(a).boolean_difference(b)
+
+    for result in (block.boolean_difference(a, b), block.boolean_difference([a, b])):
+        assert isinstance(result, BlockMesh)
+        assert result.volume() == pytest.approx(expected.volume())
+        assert _bounds(result) == pytest.approx(_bounds(expected))
+        assert result.volume() < block.volume()
+
+
+def test_boolean_difference_without_others():
+    block = _box([0.0, 0.0, 0.0], 2.0, 2.0, 2.0)
+    for result in (block.boolean_difference(), block.boolean_difference([])):
+        assert result is not block
+        assert result.volume() == pytest.approx(block.volume())
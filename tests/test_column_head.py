@@ -0,0 +1,46 @@
+import numpy as np
+
+from compas.geometry import Translation
+from compas_grid.elements import ColumnHeadCrossElement
+from compas_grid.elements.column_head import CrossBlockShape
+from compas_grid.models import GridModel
+
+
+def test_identical_column_heads_share_element_geometry():
+    model = GridModel()
+    a = model.add_element(ColumnHeadCrossElement(width=170, transformation=Translation.from_vector([1.0, 0.0, 0.0])))
+    b = model.add_element(ColumnHeadCrossElement(width=170, transformation=Translation.from_vector([0.0, 2.0, 0.0])))
+    shared = np.asarray(a.elementgeometry.vertices_attributes("xyz"), dtype=float)
+
+    assert a.elementgeometry is b.elementgeometry
+    assert a.modelgeometry is not b.modelgeometry
+    assert a.modelgeometry is not a.elementgeometry
+    assert np.allclose(a.modelgeometry.vertices_attributes("xyz"), shared + [1.0, 0.0, 0.0])
+    assert np.allclose(b.modelgeometry.vertices_attributes("xyz"), shared + [0.0, 2.0, 0.0])
+    # Computing the model geometry does not modify the shared mesh.
+    assert np.allclose(a.elementgeometry.vertices_attributes("xyz"), shared)
+
+
+def test_generated_meshes_are_bounded():
+    maxsize = CrossBlockShape._generate_mesh.cache_info().maxsize
+    for width in range(maxsize + 10):
+        ColumnHeadCrossElement(width=100 + width).compute_elementgeometry()
+    assert CrossBlockShape._generate_mesh.cache_info().currsize == maxsize
+
+
+def test_face_polygons_packed():
+    model = GridModel()
+    element = model.add_element(ColumnHeadCrossElement(width=170))
+    faces = [element.modelgeometry.face_vertices(face) for face in element.modelgeometry.faces()]
+
+    packed = element.face_polygons_packed
+
+    assert packed.shape == (len(faces), max(len(face) for face in faces), 3)
+    assert packed.dtype == np.float32
+    assert not packed.flags.writeable
+    assert element.face_polygons_packed is packed
+
+    element.transformation = Translation.from_vector([1.0, 0.0, 0.0])
+    moved = element.face_polygons_packed
+    assert moved is not packed
+    assert np.allclose(moved, packed + np.float32([1, 0, 0]), equal_nan=True)
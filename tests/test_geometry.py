@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+from scipy.spatial import ConvexHull
+
+import compas_grid._geometry
+from compas.geometry import Box
+from compas.geometry import Rotation
+from compas.geometry import Transformation
+from compas.geometry import oriented_bounding_box
+from compas.geometry import transform_points_numpy
+from compas_grid._geometry import convex_hull_mesh_numpy
+from compas_grid._geometry import obb_from_points_numpy
+
+
+def _rotated(points) -> np.ndarray:
+    rotation = Rotation.from_axis_and_angle([1.0, 2.0, 3.0], 0.7) * Rotation.from_axis_and_angle([0.0, 0.0, 1.0], 0.3)
+    return transform_points_numpy(np.asarray(points, dtype=float), rotation) + [5.0, -2.0, 1.0]
+
+
+def _extruded(section, length: float) -> np.ndarray:
+    section = np.asarray(section, dtype=float)
+    return np.vstack((np.column_stack((section, np.zeros(len(section)))), np.column_stack((section, np.full(len(section), length)))))
+
+
+def _t_profile() -> list[list[float]]:
+    return [[0.15, -0.25], [-0.15, -0.25], [-0.15, -0.15], [-0.05, -0.15], [-0.05, 0.25], [0.05, 0.25], [0.05, -0.15], [0.15, -0.15]]
+
+
+def _regular_polygon(sides: int, radius: float) -> list[list[float]]:
+    angles = np.linspace(0.0, 2 * np.pi, sides, endpoint=False)
+    return np.column_stack((radius * np.cos(angles), radius * np.sin(angles))).tolist()
+
+
+def _sizes(box: Box) -> list[float]:
+    return sorted([box.xsize, box.ysize, box.zsize])
+
+
+def _assert_contains(box: Box, points: np.ndarray):
+    local = transform_points_numpy(points, Transformation.from_frame(box.frame).inverse())
+    assert np.all(np.abs(local) <= 0.5 * np.asarray([box.xsize, box.ysize, box.zsize]) + 1e-9)
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        _rotated(Box(1.0, 2.0, 3.0).points),
+        _rotated(_extruded(_t_profile(), 3.0)),
+    ],
+    ids=["box", "t-profile"],
+)
+def test_obb_from_points_numpy_matches_oriented_bounding_box(points):
+    box = obb_from_points_numpy(points)
+    expected = Box.from_bounding_box(oriented_bounding_box(points))
+    assert _sizes(box) == pytest.approx(_sizes(expected))
+    assert list(box.frame.point) == pytest.approx(list(expected.frame.point))
+    _assert_contains(box, points)
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        _rotated(_extruded([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]], 0.1)),
+        _rotated(_extruded(_regular_polygon(8, 0.05), 4.0)),
+    ],
+    ids=["square-plate", "regular-cable"],
+)
+def test_obb_from_points_numpy_tied_variances(monkeypatch, points):
+    calls = []
+
+    def fallback(points):
+        calls.append(points)
+        return oriented_bounding_box(points)
+
+    monkeypatch.setattr(compas_grid._geometry, "oriented_bounding_box", fallback)
+    box = obb_from_points_numpy(points)
+
+    assert len(calls) == 1
+    assert _sizes(box) == pytest.approx(_sizes(Box.from_bounding_box(oriented_bounding_box(points))))
+    _assert_contains(box, points)
+
+
+def test_obb_from_points_numpy_contains_random_points():
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        points = rng.normal(size=(50, 3)) * rng.uniform(0.1, 5.0, 3)
+        _assert_contains(obb_from_points_numpy(points), points)
+
+
+def test_convex_hull_mesh_numpy_duplicates_and_orientation():
+    rng = np.random.default_rng(2)
+    points = rng.normal(size=(60, 3))
+    # Exact duplicates, as the shared corners of mesh copies, and duplicates below the rounding precision.
+    points = np.vstack((points, points[:20], points[20:30] + 1e-11))
+
+    mesh = convex_hull_mesh_numpy(points)
+    vertices = np.asarray(mesh.vertices_attributes("xyz"), dtype=float)
+
+    assert len(np.unique(vertices.round(8), axis=0)) == len(vertices)
+    assert mesh.is_closed()
+    assert mesh.volume() == pytest.approx(ConvexHull(points).volume)
+    centroid = vertices.mean(axis=0)
+    for face in mesh.faces():
+        assert np.dot(mesh.face_normal(face), np.asarray(mesh.face_centroid(face)) - centroid) > 0
+
+
+def test_convex_hull_mesh_numpy_box_corners():
+    # The corners of a box, repeated as in the vertices of separate face polygons.
+    corners = np.asarray(Box(1.0, 2.0, 3.0).points, dtype=float)
+    mesh = convex_hull_mesh_numpy(np.vstack([corners] * 3))
+    assert mesh.number_of_vertices() == 8
+    assert mesh.volume() == pytest.approx(6.0)
+    for face in mesh.faces():
+        assert np.dot(mesh.face_normal(face), mesh.face_centroid(face)) > 0
@@ -0,0 +1,109 @@
+import pytest
+
+from compas.geometry import Polygon
+from compas.geometry import Rotation
+from compas.geometry import Translation
+from compas_grid.elements import BeamElement
+from compas_grid.elements import ColumnElement
+from compas_grid.elements import ColumnHeadCrossElement
+from compas_grid.elements import PlateElement
+from compas_grid.models import GridModel
+
+
+def _mixed_model() -> GridModel:
+    model = GridModel()
+    for i in range(3):
+        transformation = Translation.from_vector([4.0 * i, 0.0, 0.0]) * Rotation.from_axis_and_angle([0, 1, 0], 0.3 * i)
+        model.add_element(BeamElement(0.2, 0.3, 4.0, transformation=transformation))
+        model.add_element(ColumnElement(0.4, 0.4, 3.0, transformation=Translation.from_vector([4.0 * i, 2.0, 0.0])))
+        model.add_element(PlateElement(Polygon([[0, 0, 0], [3, 0, 0], [3, 2, 0], [0, 2, 0]]), 0.2, transformation=Translation.from_vector([4.0 * i, 0.0, 3.0])))
+    for i, width in enumerate([150, 200, 250]):
+        model.add_element(ColumnHeadCrossElement(width=width, height=width, transformation=Translation.from_vector([4.0 * i, 2.0, 3.0])))
+    return model
+
+
+@pytest.mark.parametrize("inflate", [0.5, 1.5])
+def test_compute_aabbs_inflate_does_not_change_aabb(inflate):
+    model = _mixed_model()
+    elements = list(model.elements())
+    sizes = [(box.xsize, box.ysize, box.zsize) for box in model.compute_aabbs()]
+
+    boxes = model.compute_aabbs(inflate=inflate)
+
+    for element, box, (xsize, ysize, zsize) in zip(elements, boxes, sizes):
+        assert element.aabb.xsize == pytest.approx(xsize)
+        assert element.aabb.ysize == pytest.approx(ysize)
+        assert element.aabb.zsize == pytest.approx(zsize)
+        assert box.xsize == pytest.approx(xsize + inflate)
+        assert box.ysize == pytest.approx(ysize + inflate)
+        assert box.zsize == pytest.approx(zsize + inflate)
+
+
+def test_compute_aabbs_matches_element_aabb():
+    model = _mixed_model()
+    for element, box in zip(model.elements(), model.compute_aabbs()):
+        expected = element.compute_aabb()
+        assert list(box.frame.point) == pytest.approx(list(expected.frame.point))
+        assert (box.xsize, box.ysize, box.zsize) == pytest.approx((expected.xsize, expected.ysize, expected.zsize))
+
+
+def _overlaps(bounds, query):
+    return [i for i, box in enumerate(bounds) if all(box[k] <= query[k + 3] and box[k + 3] >= query[k] for k in range(3))]
+
+
+@pytest.mark.parametrize("inflate", [None, 1.5])
+def test_compute_aabbindex_query_matches_brute_force(inflate):
+    model = _mixed_model()
+    elements = list(model.elements())
+    bounds = []
+    for box in model.compute_aabbs(inflate=inflate):
+        points = [list(point) for point in box.points]
+        bounds.append([min(p[k] for p in points) for k in range(3)] + [max(p[k] for p in points) for k in range(3)])
+
+    index = model.compute_aabbindex(inflate=inflate, node_size=2)
+
+    assert index.elements == elements
+    for query in bounds + [[-1.0, -1.0, -1.0, 1.0, 1.0, 1.0], [100.0, 100.0, 100.0, 101.0, 101.0, 101.0]]:
+        assert index.query(query).tolist() == _overlaps(bounds, query)
+
+
+def test_compute_aabbindex_does_not_change_aabb():
+    model = _mixed_model()
+    sizes = [(box.xsize, box.ysize, box.zsize) for box in model.compute_aabbs()]
+
+    model.compute_aabbindex(inflate=1.5)
+
+    for element, size in zip(model.elements(), sizes):
+        assert (element.aabb.xsize, element.aabb.ysize, element.aabb.zsize) == pytest.approx(size)
+
+
+def _sorted_vertices(mesh):
+    return sorted(tuple(round(c, 9) for c in xyz) for xyz in mesh.vertices_attributes("xyz"))
+
+
+def _column_heads_model() -> GridModel:
+    model = _mixed_model()
+    for i in range(4):
+        for width in [150, 200, 250]:
+            model.add_element(ColumnHeadCrossElement(width=width, height=width + i, transformation=Translation.from_vector([0.0, 0.0, 3.0 * i])))
+    return model
+
+
+def test_max_workers_matches_serial():
+    # The threaded model goes first, so that the shared column head shapes are created concurrently.
+    threaded = _column_heads_model()
+    threaded_boxes = threaded.compute_aabbs(max_workers=8)
+    threaded_meshes = threaded.compute_collision_meshes(max_workers=8)
+
+    serial = _column_heads_model()
+    serial_boxes = serial.compute_aabbs()
+    serial_meshes = serial.compute_collision_meshes()
+
+    for threaded_box, serial_box in zip(threaded_boxes, serial_boxes):
+        assert list(threaded_box.frame.point) == pytest.approx(list(serial_box.frame.point))
+        assert (threaded_box.xsize, threaded_box.ysize, threaded_box.zsize) == pytest.approx((serial_box.xsize, serial_box.ysize, serial_box.zsize))
+    for threaded_mesh, serial_mesh in zip(threaded_meshes, serial_meshes):
+        assert threaded_mesh.number_of_faces() == serial_mesh.number_of_faces()
+        assert _sorted_vertices(threaded_mesh) == _sorted_vertices(serial_mesh)
+    for element, mesh in zip(threaded.elements(), threaded_meshes):
+        assert element.collision_mesh is mesh
@@ -0,0 +1,29 @@
+import numpy as np
+
+from compas.geometry import Polygon
+from compas.geometry import Translation
+from compas_grid.elements import PlateElement
+from compas_grid.models import GridModel
+
+
+def test_face_polygons_packed():
+    # A pentagonal plate has two pentagons and five quads, the quads are padded with NaN.
+    model = GridModel()
+    plate = model.add_element(PlateElement(Polygon.from_sides_and_radius_xy(5, 1.0), 0.2))
+    mesh = plate.modelgeometry
+
+    packed = plate.face_polygons_packed
+
+    assert packed.shape == (7, 5, 3)
+    assert packed.dtype == np.float32
+    assert not packed.flags.writeable
+    assert plate.face_polygons_packed is packed
+    for face, polygon in zip(mesh.faces(), packed):
+        points = mesh.vertices_attributes("xyz", keys=mesh.face_vertices(face))
+        assert np.allclose(polygon[: len(points)], points, atol=1e-6)
+        assert np.isnan(polygon[len(points) :]).all()
+
+    plate.transformation = Translation.from_vector([0.0, 0.0, 1.0])
+    moved = plate.face_polygons_packed
+    assert moved is not packed
+    assert np.allclose(moved, packed + np.float32([0, 0, 1]), equal_nan=True)